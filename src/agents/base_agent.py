@@ -6,6 +6,7 @@ from langchain_ollama import ChatOllama
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.tools import BaseTool
 from langchain_core.messages import HumanMessage, SystemMessage
+from ..utils.llm_client import shared_async_client_kwargs
 from ..utils.text_processing import strip_reasoning
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,8 @@ class BaseAgent(ABC):
         # Setup LLM parameters
         default_params = {
             "model": self.model,
-            "temperature": 0.7
+            "temperature": 0.7,
+            "async_client_kwargs": shared_async_client_kwargs()
         }
         if llm_params:
             default_params.update(llm_params)
@@ -117,7 +119,7 @@ class BaseAgent(ABC):
         response = await self.llm.ainvoke(messages)
         
         # Handle tool calls if present
-        if hasattr(response, 'tool_calls') and response.tool_calls:
+        if getattr(response, 'tool_calls', None):
             self._last_tool_calls = response.tool_calls  # Track calls
             self._tools_used_this_turn = True  # Set flag
             
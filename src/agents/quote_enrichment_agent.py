@@ -1,8 +1,11 @@
 """Agent for enriching discussion with strategically placed philosophical quotes"""
 
 import logging
+import os
 import random
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple
+import numpy as np
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.agents.base_agent import BaseAgent
@@ -58,7 +61,9 @@ class QuoteEnrichmentAgent(BaseAgent):
         self,
         quote_interval: int = 8,
         enable_voice_adaptation: bool = True,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        adaptation_cache_size: Optional[int] = None,
+        embedding_model=None
     ):
         """
         Initialize quote enrichment agent
@@ -67,6 +72,9 @@ class QuoteEnrichmentAgent(BaseAgent):
             quote_interval: Turns between quote placements
             enable_voice_adaptation: Whether to adapt quotes to speaker voice
             session_id: Session identifier
+            adaptation_cache_size: Max cached voice adaptations (0 disables);
+                defaults to QUOTE_ADAPTATION_CACHE_SIZE or 128
+            embedding_model: Preloaded sentence transformer for the retriever
         """
         super().__init__(
             agent_id="quote_enrichment",
@@ -78,7 +86,13 @@ class QuoteEnrichmentAgent(BaseAgent):
         
         self.quote_interval = quote_interval
         self.enable_voice_adaptation = enable_voice_adaptation
-        self.retriever = QuoteRetriever()
+        self.retriever = QuoteRetriever(embedding_model=embedding_model)
+        
+        # LRU cache of voice adaptations keyed by everything the prompt depends on
+        if adaptation_cache_size is None:
+            adaptation_cache_size = int(os.getenv("QUOTE_ADAPTATION_CACHE_SIZE", "128"))
+        self.adaptation_cache_size = adaptation_cache_size
+        self._adaptation_cache: OrderedDict[Tuple, str] = OrderedDict()
         
         # Tracking
         self.turns_since_last_quote = 0
@@ -110,7 +124,8 @@ class QuoteEnrichmentAgent(BaseAgent):
         speaker: ParticipantState,
         discussion_topics: List[str],
         current_tension: Optional[Tuple[str, str]] = None,
-        discussion_context: str = ""
+        discussion_context: str = "",
+        topic_embedding: Optional[np.ndarray] = None
     ) -> str:
         """
         Add a philosophical quote to the response
@@ -121,6 +136,8 @@ class QuoteEnrichmentAgent(BaseAgent):
             discussion_topics: Current discussion topics
             current_tension: Optional philosophical tension
             discussion_context: Recent discussion for context
+            topic_embedding: Precomputed retriever.embed_topics() result for
+                discussion_topics/current_tension, reused across turns
             
         Returns:
             Enhanced response with quote
@@ -133,7 +150,8 @@ class QuoteEnrichmentAgent(BaseAgent):
             current_tension=current_tension,
             exclude_authors=[speaker.name],  # Don't quote themselves
             top_k=3,
-            relevance_threshold=0.4  # Lower threshold for keyword fallback
+            relevance_threshold=0.4,  # Lower threshold for keyword fallback
+            query_embedding=topic_embedding
         )
         
         if not quotes:
@@ -184,6 +202,18 @@ class QuoteEnrichmentAgent(BaseAgent):
         
         Uses similar voice adaptation logic to RAG style transfer
         """
+        context_tail = context[-300:] if context else ""
+        cache_key = (
+            quote.get('id'), quote['quote'], quote['author'],
+            speaker.name, speaker.personality.value, speaker.expertise_area,
+            context_tail
+        )
+        cached = self._adaptation_cache.get(cache_key)
+        if cached is not None:
+            self._adaptation_cache.move_to_end(cache_key)
+            logger.debug(f"Reusing cached adaptation for {quote['author']} quote")
+            return cached
+        
         prompt = f"""Speaker: {speaker.name}
 Personality: {speaker.personality.value}
 Expertise: {speaker.expertise_area}
@@ -191,7 +221,7 @@ Expertise: {speaker.expertise_area}
 Original Quote: "{quote['quote']}" — {quote['author']}
 
 Recent Discussion Context:
-{context[-300:] if context else "Philosophical discussion in progress"}
+{context_tail or "Philosophical discussion in progress"}
 
 Adapt this quote to how {speaker.name} would naturally express it in conversation.
 Maintain the core wisdom and attribute to {quote['author']}, but phrase it in {speaker.name}'s voice."""
@@ -209,6 +239,10 @@ Maintain the core wisdom and attribute to {quote['author']}, but phrase it in {s
             if not adapted or adapted.isspace():
                 logger.warning("Quote adaptation resulted in empty response, using original")
                 adapted = f'"{quote["quote"]}" — {quote["author"]}'
+            elif self.adaptation_cache_size > 0:
+                self._adaptation_cache[cache_key] = adapted
+                if len(self._adaptation_cache) > self.adaptation_cache_size:
+                    self._adaptation_cache.popitem(last=False)
             
             logger.debug(f"Adapted quote: {adapted[:80]}...")
             return adapted
@@ -8,6 +8,11 @@ from rich.markdown import Markdown
 from src.config import TalksConfig
 from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
 
 
@@ -162,12 +167,13 @@ def main(topic: str, file: str, depth: int, participants: int, panel: str, confi
     
     console.print("\n" + "─" * 60 + "\n")
     
-    # Run discussion
-    asyncio.run(run_discussion(topic, depth, participants_config, max_turns, narrator,
-                               synthesis, synthesis_style, synthesis_freq, rag_styling, coda,
-                               not no_math_model, redundancy_control, dyad_limit, similarity_threshold,
-                               progression_control, cycles_threshold, max_consequence_tests,
-                               quotes, quote_interval, not no_quote_adaptation))
+    # Run discussion (on uvloop when available)
+    run = uvloop.run if uvloop else asyncio.run
+    run(run_discussion(topic, depth, participants_config, max_turns, narrator,
+                       synthesis, synthesis_style, synthesis_freq, rag_styling, coda,
+                       not no_math_model, redundancy_control, dyad_limit, similarity_threshold,
+                       progression_control, cycles_threshold, max_consequence_tests,
+                       quotes, quote_interval, not no_quote_adaptation))
 
 
 async def run_discussion(topic: str, depth: int, participants_config: list, max_turns: int, enable_narrator: bool,
@@ -274,7 +280,7 @@ async def run_discussion(topic: str, depth: int, participants_config: list, max_
         console.print(f"  • {state.name}: {state.speaking_turns} turns, {state.words_spoken} words")
     
     # DISPLAY STRATEGIC METRICS
-    if orchestrator.enable_strategic_scoring and hasattr(orchestrator, 'strategic_metrics') and orchestrator.strategic_metrics:
+    if orchestrator.enable_strategic_scoring and getattr(orchestrator, 'strategic_metrics', None):
         metrics = orchestrator.strategic_metrics
         
         console.print("\n[bold]📊 Strategic Metrics:[/bold]")
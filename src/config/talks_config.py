@@ -18,6 +18,13 @@ class TalksConfig:
     
     def _load_config(self):
         """Load configuration from talks.yml file"""
+        self._read_config()
+        
+        # Every dotted key is resolved once per (re)load so get() is a single lookup
+        self._resolved = self._flatten(self._config)
+    
+    def _read_config(self):
+        """Read talks.yml into self._config, falling back to defaults"""
         # Look for config file in project root
         config_paths = [
             Path("talks.yml"),
@@ -129,18 +136,25 @@ class TalksConfig:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key (supports nested keys with dots)"""
-        keys = key.split('.')
-        value = self._config
+        value = self._resolved.get(key)
+        return default if value is None else value
+    
+    @staticmethod
+    def _flatten(config: Any, prefix: str = "") -> Dict[str, Any]:
+        """Map every dotted key path in the config to its value (nested dicts included)"""
+        flat = {}
+        if not isinstance(config, dict):
+            return flat
         
-        for k in keys:
+        for k, value in config.items():
+            if not isinstance(k, str):
+                continue
+            key = prefix + k
+            flat[key] = value
             if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
+                flat.update(TalksConfig._flatten(value, key + "."))
         
-        return value
+        return flat
     
     @property
     def rag_style_transfer_enabled(self) -> bool:
@@ -1,5 +1,5 @@
 """Controllers for orchestrating discussion management"""
 
-from .progression_controller import ProgressionController, ProgressionConfig, ProgressionState
+from .progression_controller import ProgressionController, ProgressionConfig, ProgressionState, ProgressionMetrics, TurnResult
 
-__all__ = ['ProgressionController', 'ProgressionConfig', 'ProgressionState']
\ No newline at end of file
+__all__ = ['ProgressionController', 'ProgressionConfig', 'ProgressionState', 'ProgressionMetrics', 'TurnResult']
\ No newline at end of file
@@ -2,11 +2,16 @@
 
 import asyncio
 from typing import Dict, List, Optional, Set, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..states.tension_state import TensionState, ConsequenceTest
 from ..utils.topic_extractor import TopicExtractor
 from ..utils.entailment_detector import EntailmentDetector, EntailmentType
@@ -14,6 +19,12 @@ from ..agents.consequence_test_generator import ConsequenceTestGenerator, Conseq
 from ..utils.llm_client import LLMClient
 
 
+# Topic extraction and entailment detection are stateless after construction,
+# so every controller shares one instance of each unless given its own
+_DEFAULT_TOPIC_EXTRACTOR = TopicExtractor()
+_DEFAULT_ENTAILMENT_DETECTOR = EntailmentDetector()
+
+
 @dataclass
 class ProgressionConfig:
     """Configuration for progression control"""
@@ -37,7 +48,7 @@ class ProgressionState:
     tensions: Dict[Tuple[str, str], TensionState]
     turn_index: int = 0
     last_pivot_turn: int = -1
-    recent_topics: List[Set[str]] = None
+    recent_topics: List[int] = None  # topic bitmasks from TopicExtractor.topic_mask
     current_tension: Optional[Tuple[str, str]] = None
     pending_tests: List[ConsequenceTest] = None
     
@@ -48,60 +59,100 @@ class ProgressionState:
             self.pending_tests = []
 
 
+@dataclass(slots=True)
+class TurnResult:
+    """Outcome of processing a single turn
+    
+    Supports dict-style access (``result["state_update"]``, ``result.get(...)``)
+    so existing callers keep working.
+    """
+    interventions: List[Dict[str, Any]] = field(default_factory=list)
+    state_update: Dict[str, Any] = field(default_factory=dict)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+
+@dataclass(slots=True)
+class ProgressionMetrics:
+    """Fixed-layout counters for progression control"""
+    orbit_count: int = 0
+    tests_injected: int = 0
+    pivots_forced: int = 0
+    entailments_detected: int = 0
+    turns_processed: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Snapshot counters as a plain dict for reports and persistence"""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def update(self, values: Dict[str, int]):
+        """Restore counters from a dict, ignoring unknown keys"""
+        for name, value in values.items():
+            if name in self.__slots__:
+                setattr(self, name, value)
+
+
 class ProgressionController:
     """Main controller for discussion progression and orbit prevention"""
     
-    def __init__(self, config: ProgressionConfig, llm_client: Optional[LLMClient] = None):
+    def __init__(self, config: ProgressionConfig, llm_client: Optional[LLMClient] = None,
+                 topic_extractor: Optional[TopicExtractor] = None,
+                 entailment_detector: Optional[EntailmentDetector] = None):
         """Initialize progression controller"""
         self.config = config
         self.llm_client = llm_client or LLMClient()
         
         # Core components
-        self.topic_extractor = TopicExtractor()
-        self.entailment_detector = EntailmentDetector()
+        self.topic_extractor = topic_extractor or _DEFAULT_TOPIC_EXTRACTOR
+        self.entailment_detector = entailment_detector or _DEFAULT_ENTAILMENT_DETECTOR
         self.test_generator = ConsequenceTestGenerator(llm_client)
         
         # State
         self.state = ProgressionState(tensions={})
         
         # Metrics
-        self.metrics = {
-            "orbit_count": 0,
-            "tests_injected": 0,
-            "pivots_forced": 0,
-            "entailments_detected": 0,
-            "turns_processed": 0
-        }
+        self.metrics = ProgressionMetrics()
     
-    async def process_turn(self, content: str, speaker: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def process_turn(self, content: str, speaker: str, context: Dict[str, Any] = None) -> TurnResult:
         """Process a discussion turn and determine any interventions needed"""
         
         if not self.config.enable_progression:
-            return {"interventions": [], "state_update": {}}
+            return TurnResult()
         
         self.state.turn_index += 1
-        self.metrics["turns_processed"] += 1
+        self.metrics.turns_processed += 1
         
         # Extract topics and detect tensions
         current_topics = self.topic_extractor.extract_topics(content)
-        self.state.recent_topics.append(current_topics)
+        current_mask = self.topic_extractor.topic_mask(current_topics)
+        
+        # Combine with the recent topic window before recording this turn
+        window_mask = current_mask
+        if self.config.topic_window > 0:
+            for recent_mask in self.state.recent_topics[-self.config.topic_window:]:
+                window_mask |= recent_mask
+        active_tensions = self.topic_extractor.tensions_from_mask(window_mask)
         
         # Keep only recent topic history
+        self.state.recent_topics.append(current_mask)
         if len(self.state.recent_topics) > self.config.topic_window + 1:
             self.state.recent_topics.pop(0)
         
-        active_tensions = self.topic_extractor.detect_tensions(
-            content, 
-            self.state.recent_topics[:-1], 
-            self.config.topic_window
-        )
-        
         # Detect entailments
         entailments = self.entailment_detector.detect(content)
         has_entailment = len(entailments) > 0
         
         if has_entailment:
-            self.metrics["entailments_detected"] += 1
+            self.metrics.entailments_detected += 1
         
         # Update tension states
         interventions = []
@@ -117,22 +168,22 @@ class ProgressionController:
                     test_intervention = await self._create_consequence_test(tension_state, content, context)
                     if test_intervention:
                         interventions.append(test_intervention)
-                        self.metrics["tests_injected"] += 1
+                        self.metrics.tests_injected += 1
                 
                 elif tension_state.should_pivot():
                     pivot_intervention = await self._create_pivot_intervention(tension_state, context)
                     if pivot_intervention:
                         interventions.append(pivot_intervention)
-                        self.metrics["pivots_forced"] += 1
+                        self.metrics.pivots_forced += 1
                         self.state.last_pivot_turn = self.state.turn_index
             else:
                 # Record entailment and reset cycles
                 tension_state.record_entailment(self.state.turn_index)
         
         # Check for orbiting (multiple tensions saturated without progress)
-        saturated_tensions = [ts for ts in self.state.tensions.values() if ts.is_saturated()]
-        if len(saturated_tensions) > 1:
-            self.metrics["orbit_count"] += 1
+        saturated_count = sum(1 for ts in self.state.tensions.values() if ts.is_saturated())
+        if saturated_count > 1:
+            self.metrics.orbit_count += 1
         
         # Process any pending consequence test responses
         await self._process_pending_tests(content, entailments)
@@ -144,23 +195,27 @@ class ProgressionController:
             if synthesis_intervention:
                 interventions.append(synthesis_intervention)
         
-        return {
-            "interventions": interventions,
-            "state_update": {
+        return TurnResult(
+            interventions=interventions,
+            state_update={
                 "turn_index": self.state.turn_index,
                 "active_tensions": list(active_tensions),
                 "current_topics": list(current_topics),
                 "has_entailment": has_entailment,
                 "entailment_types": [e.value for e in entailments],
-                "saturated_tensions": len(saturated_tensions),
-                "metrics": self.metrics.copy()
+                "saturated_tensions": saturated_count,
+                "metrics": self.metrics.to_dict()
             }
-        }
+        )
     
     def _get_or_create_tension_state(self, tension: Tuple[str, str]) -> TensionState:
         """Get or create tension state for a tension pair"""
-        normalized_tension = tuple(sorted(tension))
+        # Pairs from the topic extractor are already normalized
+        tension_state = self.state.tensions.get(tension)
+        if tension_state is not None:
+            return tension_state
         
+        normalized_tension = tuple(sorted(tension))
         if normalized_tension not in self.state.tensions:
             self.state.tensions[normalized_tension] = TensionState(
                 pair=normalized_tension,
@@ -326,7 +381,7 @@ class ProgressionController:
                 "recent_topics_count": len(self.state.recent_topics)
             },
             "tensions": tension_statuses,
-            "metrics": self.metrics.copy()
+            "metrics": self.metrics.to_dict()
         }
     
     def save_state(self, filepath: str):
@@ -338,7 +393,7 @@ class ProgressionController:
             "turn_index": self.state.turn_index,
             "last_pivot_turn": self.state.last_pivot_turn,
             "current_tension": self.state.current_tension,
-            "metrics": self.metrics,
+            "metrics": self.metrics.to_dict(),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -362,8 +417,11 @@ class ProgressionController:
         
         # Save to file
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(serializable_state, f, indent=2)
+        if orjson is not None:
+            Path(filepath).write_bytes(orjson.dumps(serializable_state, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(serializable_state, f, indent=2)
     
     def load_state(self, filepath: str):
         """Load progression state from file"""
@@ -371,8 +429,11 @@ class ProgressionController:
         if not Path(filepath).exists():
             return
         
-        with open(filepath, 'r') as f:
-            saved_state = json.load(f)
+        if orjson is not None:
+            saved_state = orjson.loads(Path(filepath).read_bytes())
+        else:
+            with open(filepath, 'r') as f:
+                saved_state = json.load(f)
         
         # Restore basic state
         self.state.turn_index = saved_state.get("turn_index", 0)
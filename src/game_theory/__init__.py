@@ -1,13 +1,25 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DialogueMove:
     """A possible dialogue move by a participant"""
     move_type: str  # DEEPEN, CHALLENGE, SUPPORT, QUESTION, SYNTHESIZE, CONCLUDE
     target: Optional[str] = None  # participant_id or None for group
     intensity: float = 0.5  # 0-1
+    
+    @classmethod
+    def of(cls, move_type: str, target: Optional[str] = None) -> 'DialogueMove':
+        """Shared instance of a move with default intensity (moves are immutable)"""
+        key = (move_type, target)
+        move = _MOVE_POOL.get(key)
+        if move is None:
+            move = _MOVE_POOL[key] = cls(move_type=move_type, target=target)
+        return move
+
+
+_MOVE_POOL: Dict[Tuple[str, Optional[str]], DialogueMove] = {}
 
 
 # Move types constant
@@ -1,9 +1,68 @@
 # src/game_theory/agent_objective.py
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, Optional
 from src.game_theory import DialogueMove
 
+# Objective dimensions in declaration order (ties resolve to the earliest)
+_OBJECTIVE_FIELDS = (
+    "truth_seeking",
+    "ethical_coherence",
+    "metaphoric_elegance",
+    "empirical_grounding",
+    "dialectical_tension"
+)
+_objective_values = attrgetter(*_OBJECTIVE_FIELDS)
+
+
+# Objective weights per personality archetype, built once at import instead
+# of on every from_personality() call
+_PERSONALITY_OBJECTIVES: Dict[str, Dict[str, float]] = {
+    "analytical": dict(
+        truth_seeking=0.9,
+        empirical_grounding=0.8,
+        dialectical_tension=0.5,
+        ethical_coherence=0.6,
+        metaphoric_elegance=0.3
+    ),
+    "skeptical": dict(
+        dialectical_tension=0.9,
+        truth_seeking=0.7,
+        empirical_grounding=0.6,
+        ethical_coherence=0.4,
+        metaphoric_elegance=0.4
+    ),
+    "creative": dict(
+        metaphoric_elegance=0.9,
+        truth_seeking=0.5,
+        ethical_coherence=0.6,
+        dialectical_tension=0.5,
+        empirical_grounding=0.4
+    ),
+    "collaborative": dict(
+        ethical_coherence=0.9,
+        truth_seeking=0.6,
+        dialectical_tension=0.3,
+        metaphoric_elegance=0.5,
+        empirical_grounding=0.5
+    ),
+    "assertive": dict(
+        dialectical_tension=0.7,
+        ethical_coherence=0.7,
+        truth_seeking=0.6,
+        empirical_grounding=0.5,
+        metaphoric_elegance=0.4
+    ),
+    "cautious": dict(
+        empirical_grounding=0.9,
+        truth_seeking=0.8,
+        ethical_coherence=0.7,
+        dialectical_tension=0.3,
+        metaphoric_elegance=0.3
+    )
+}
+
 
 @dataclass
 class AgentObjective:
@@ -34,14 +93,8 @@ class AgentObjective:
         Returns:
             Name of the dominant objective dimension
         """
-        objectives = {
-            "truth_seeking": self.truth_seeking,
-            "ethical_coherence": self.ethical_coherence,
-            "metaphoric_elegance": self.metaphoric_elegance,
-            "empirical_grounding": self.empirical_grounding,
-            "dialectical_tension": self.dialectical_tension
-        }
-        return max(objectives.items(), key=lambda x: x[1])[0]
+        values = _objective_values(self)
+        return _OBJECTIVE_FIELDS[values.index(max(values))]
     
     def get_objective_vector(self) -> Dict[str, float]:
         """Return objectives as a dictionary"""
@@ -132,53 +185,9 @@ class AgentObjective:
         Returns:
             AgentObjective tuned to that personality
         """
-        mapping = {
-            "analytical": AgentObjective(
-                truth_seeking=0.9,
-                empirical_grounding=0.8,
-                dialectical_tension=0.5,
-                ethical_coherence=0.6,
-                metaphoric_elegance=0.3
-            ),
-            "skeptical": AgentObjective(
-                dialectical_tension=0.9,
-                truth_seeking=0.7,
-                empirical_grounding=0.6,
-                ethical_coherence=0.4,
-                metaphoric_elegance=0.4
-            ),
-            "creative": AgentObjective(
-                metaphoric_elegance=0.9,
-                truth_seeking=0.5,
-                ethical_coherence=0.6,
-                dialectical_tension=0.5,
-                empirical_grounding=0.4
-            ),
-            "collaborative": AgentObjective(
-                ethical_coherence=0.9,
-                truth_seeking=0.6,
-                dialectical_tension=0.3,
-                metaphoric_elegance=0.5,
-                empirical_grounding=0.5
-            ),
-            "assertive": AgentObjective(
-                dialectical_tension=0.7,
-                ethical_coherence=0.7,
-                truth_seeking=0.6,
-                empirical_grounding=0.5,
-                metaphoric_elegance=0.4
-            ),
-            "cautious": AgentObjective(
-                empirical_grounding=0.9,
-                truth_seeking=0.8,
-                ethical_coherence=0.7,
-                dialectical_tension=0.3,
-                metaphoric_elegance=0.3
-            )
-        }
-        
-        return mapping.get(personality, AgentObjective())
+        # A fresh instance per participant, since objectives are mutable
+        return AgentObjective(**_PERSONALITY_OBJECTIVES.get(personality, {}))
 
     def __repr__(self) -> str:
         dominant = self.get_dominant_objective()
-        return f"AgentObjective(dominant={dominant})"
\ No newline at end of file
+        return f"AgentObjective(dominant={dominant})"
@@ -1,4 +1,5 @@
 import numpy as np
+from collections import Counter
 from typing import Dict, Tuple
 from src.states.participant_state import ParticipantState, PersonalityArchetype
 from src.states.group_state import GroupDiscussionState
@@ -22,13 +23,11 @@ class PayoffCalculator:
         
         other_participants = group_state.get_other_participants(speaker.participant_id)
         recent_speakers = group_state.get_recent_speakers(n=2)
+        recent_moves = Counter(e.get("move") for e in group_state.exchanges[-3:])
         
         # DEEPEN move payoff
         depth_gap = group_state.target_depth - speaker.depth_explored
-        recent_deepening = any(
-            e.get("move") == "DEEPEN" 
-            for e in group_state.exchanges[-3:] if group_state.exchanges
-        )
+        recent_deepening = recent_moves["DEEPEN"] > 0
         
         payoffs["DEEPEN"] = (
             depth_gap * 0.3 +
@@ -97,15 +96,15 @@ class PayoffCalculator:
         # ADJUST PAYOFFS BASED ON AGENT OBJECTIVES
         if speaker.objective:
             for move_type, base_payoff in payoffs.items():
-                # Create a mock move for scoring
-                mock_move = DialogueMove(move_type=move_type)
+                # Shared mock move for scoring
+                mock_move = DialogueMove.of(move_type)
                 
                 # Build simple context for objective scoring
                 context = {
                     "move_type": move_type,
-                    "recent_challenges": sum(1 for e in group_state.exchanges[-3:] if e.get("move") == "CHALLENGE"),
-                    "recent_supports": sum(1 for e in group_state.exchanges[-3:] if e.get("move") == "SUPPORT"),
-                    "recent_deepens": sum(1 for e in group_state.exchanges[-3:] if e.get("move") == "DEEPEN")
+                    "recent_challenges": recent_moves["CHALLENGE"],
+                    "recent_supports": recent_moves["SUPPORT"],
+                    "recent_deepens": recent_moves["DEEPEN"]
                 }
                 
                 # Get objective alignment score
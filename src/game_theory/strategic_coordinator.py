@@ -1,7 +1,9 @@
 # src/game_theory/strategic_coordinator.py
 
 import logging
-from typing import Dict, List, Optional
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from src.states.participant_state import ParticipantState
 from src.states.group_state import GroupDiscussionState
 from src.game_theory import DialogueMove
@@ -9,6 +11,20 @@ from src.game_theory.agent_objective import AgentObjective
 
 logger = logging.getLogger(__name__)
 
+# The three numeric scores of an evaluation record, read in one call
+_score_columns = itemgetter('alignment_score', 'originality_score', 'strategic_quality')
+
+
+def _average_scores(scores: List[Dict]) -> Tuple[float, float, float]:
+    """Rounded mean alignment, originality and quality over evaluation records"""
+    alignment, originality, quality = zip(*map(_score_columns, scores))
+    count = len(scores)
+    return (
+        round(sum(alignment) / count, 3),
+        round(sum(originality) / count, 3),
+        round(sum(quality) / count, 3)
+    )
+
 
 class StrategicCoordinator:
     """
@@ -223,23 +239,18 @@ class StrategicCoordinator:
         if not self.turn_scores:
             return {}
         
-        alignment_scores = [s['alignment_score'] for s in self.turn_scores]
-        originality_scores = [s['originality_score'] for s in self.turn_scores]
-        quality_scores = [s['strategic_quality'] for s in self.turn_scores]
+        avg_alignment, avg_originality, avg_quality = _average_scores(self.turn_scores)
         
         # Count objective pursuits
-        objective_counts = {}
-        for score in self.turn_scores:
-            obj = score['dominant_objective']
-            objective_counts[obj] = objective_counts.get(obj, 0) + 1
+        objective_counts = Counter(score['dominant_objective'] for score in self.turn_scores)
         
-        dominant_theme = max(objective_counts.items(), key=lambda x: x[1])[0] if objective_counts else "none"
+        dominant_theme = objective_counts.most_common(1)[0][0] if objective_counts else "none"
         
         return {
             "total_turns_evaluated": len(self.turn_scores),
-            "avg_alignment": round(sum(alignment_scores) / len(alignment_scores), 3),
-            "avg_originality": round(sum(originality_scores) / len(originality_scores), 3),
-            "avg_quality": round(sum(quality_scores) / len(quality_scores), 3),
+            "avg_alignment": avg_alignment,
+            "avg_originality": avg_originality,
+            "avg_quality": avg_quality,
             "dominant_theme": dominant_theme,
             "objective_distribution": objective_counts
         }
@@ -259,15 +270,13 @@ class StrategicCoordinator:
         if not participant_scores:
             return None
         
-        alignment_scores = [s['alignment_score'] for s in participant_scores]
-        originality_scores = [s['originality_score'] for s in participant_scores]
-        quality_scores = [s['strategic_quality'] for s in participant_scores]
+        avg_alignment, avg_originality, avg_quality = _average_scores(participant_scores)
         
         return {
             "participant": participant_id,
             "turns": len(participant_scores),
-            "avg_alignment": round(sum(alignment_scores) / len(alignment_scores), 3),
-            "avg_originality": round(sum(originality_scores) / len(originality_scores), 3),
-            "avg_quality": round(sum(quality_scores) / len(quality_scores), 3),
+            "avg_alignment": avg_alignment,
+            "avg_originality": avg_originality,
+            "avg_quality": avg_quality,
             "dominant_objective": participant_scores[0]['dominant_objective']
         }
\ No newline at end of file
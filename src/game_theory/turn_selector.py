@@ -1,34 +1,47 @@
 import numpy as np
-from typing import Dict
+from typing import Dict, List, Optional
 from src.states.participant_state import ParticipantState, PersonalityArchetype
 from src.states.group_state import GroupDiscussionState
 
 
+# Personality-based speaking baseline
+_PERSONALITY_URGENCY = {
+    PersonalityArchetype.ASSERTIVE: 0.7,
+    PersonalityArchetype.COLLABORATIVE: 0.5,
+    PersonalityArchetype.ANALYTICAL: 0.4,
+    PersonalityArchetype.CREATIVE: 0.6,
+    PersonalityArchetype.CAUTIOUS: 0.3,
+    PersonalityArchetype.SKEPTICAL: 0.5
+}
+
+
+def _average_speaking_turns(group_state: GroupDiscussionState) -> float:
+    """Mean speaking turns across all participants"""
+    participants = group_state.participants
+    return sum(p.speaking_turns for p in participants.values()) / len(participants)
+
+
 class TurnSelector:
     """Selects next speaker using game-theoretic urgency calculation"""
     
     def calculate_speaking_urgency(
         self,
         participant: ParticipantState,
-        group_state: GroupDiscussionState
+        group_state: GroupDiscussionState,
+        avg_turns: Optional[float] = None
     ) -> float:
         """
         Calculate how much this participant wants to speak RIGHT NOW
         
+        avg_turns is the group's mean speaking turns; callers scoring every
+        participant pass it in so it is computed once per selection.
+        
         Returns: 0.0-1.0 urgency score
         """
         urgency = 0.0
         
         # Factor 1: Personality-based baseline (30%)
-        personality_urgency = {
-            PersonalityArchetype.ASSERTIVE: 0.7,
-            PersonalityArchetype.COLLABORATIVE: 0.5,
-            PersonalityArchetype.ANALYTICAL: 0.4,
-            PersonalityArchetype.CREATIVE: 0.6,
-            PersonalityArchetype.CAUTIOUS: 0.3,
-            PersonalityArchetype.SKEPTICAL: 0.5
-        }
-        urgency += personality_urgency[participant.personality] * 0.3
+        urgency += _PERSONALITY_URGENCY[participant.personality] * 0.3
         
         # Factor 2: Time since last spoke (20%)
         turns_since_spoke = group_state.turn_number - participant.last_spoke_turn
@@ -54,23 +67,31 @@ class TurnSelector:
         
         # Balance turns
         if len(group_state.participants) > 0:
-            avg_turns = np.mean([p.speaking_turns for p in group_state.participants.values()])
+            if avg_turns is None:
+                avg_turns = _average_speaking_turns(group_state)
             if participant.speaking_turns < avg_turns * 0.5:
                 urgency *= 1.3
         
         return min(1.0, urgency)
     
+    def _urgency_scores(self, group_state: GroupDiscussionState) -> Dict[str, float]:
+        """Speaking urgency for every participant, in participant order"""
+        urgency_scores = {}
+        avg_turns = _average_speaking_turns(group_state) if group_state.participants else None
+        
+        for pid, participant in group_state.participants.items():
+            urgency = self.calculate_speaking_urgency(participant, group_state, avg_turns)
+            urgency_scores[pid] = urgency
+        
+        return urgency_scores
+    
     def select_next_speaker(self, group_state: GroupDiscussionState) -> str:
         """
         Determine who speaks next using game theory
         
         Returns: participant_id of next speaker
         """
-        urgency_scores = {}
-        
-        for pid, participant in group_state.participants.items():
-            urgency = self.calculate_speaking_urgency(participant, group_state)
-            urgency_scores[pid] = urgency
+        urgency_scores = self._urgency_scores(group_state)
         
         # Add randomness (80% game theory, 20% random)
         randomized_scores = {
@@ -80,4 +101,23 @@ class TurnSelector:
         
         next_speaker = max(randomized_scores.items(), key=lambda x: x[1])[0]
         
-        return next_speaker
\ No newline at end of file
+        return next_speaker
+    
+    def select_next_speakers(self, group_state: GroupDiscussionState, n: int) -> List[str]:
+        """
+        Draw n speaker selections from an unchanged group state
+        
+        Urgencies are computed once; the random component is drawn as one
+        (n, participants) array, so with the same seed the result matches n
+        successive select_next_speaker calls.
+        
+        Returns: list of n participant_ids
+        """
+        urgency_scores = self._urgency_scores(group_state)
+        pids = list(urgency_scores)
+        
+        # Add randomness (80% game theory, 20% random)
+        urgencies = np.fromiter(urgency_scores.values(), dtype=np.float64, count=len(pids))
+        randomized_scores = urgencies * 0.8 + np.random.random((n, len(pids))) * 0.2
+        
+        return [pids[i] for i in randomized_scores.argmax(axis=1)]
@@ -2,21 +2,22 @@ import logging
 import uuid
 import asyncio
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Dict, Optional, Sequence, Tuple, Union
 from src.config import TalksConfig
 from src.states.group_state import GroupDiscussionState
-from src.states.participant_state import ParticipantState, Gender, PersonalityArchetype
+from src.states.participant_state import ParticipantState, ParticipantSpec
 from src.agents.participant_agent import ParticipantAgent
-from src.agents.narrator_agent import NarratorAgent
 from src.agents.cognitive_coda import CognitiveCodaAgent
 from src.game_theory.turn_selector import TurnSelector
 from src.game_theory.payoff_calculator import PayoffCalculator
 from src.game_theory.strategic_coordinator import StrategicCoordinator
-from src.utils.entailment_detector import EntailmentDetector
-from src.utils.redundancy_checker import RedundancyChecker
-from src.controllers.progression_controller import ProgressionController, ProgressionConfig
-from src.agents.quote_enrichment_agent import QuoteEnrichmentAgent
+
+# Optional subsystems (narrator, redundancy control, progression control,
+# quote enrichment) are imported only when an orchestrator enables them
+if TYPE_CHECKING:
+    from src.controllers.progression_controller import ProgressionController
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class MultiAgentDiscussionOrchestrator:
         self,
         topic: str,
         target_depth: int,
-        participants_config: List[Dict],
+        participants_config: Sequence[Union[ParticipantSpec, Dict]],
         enable_narrator: Optional[bool] = None,
         narrator_name: Optional[str] = None,
         enable_synthesizer: Optional[bool] = None,
@@ -46,11 +47,17 @@ class MultiAgentDiscussionOrchestrator:
         progression_config: Optional[Dict] = None,
         enable_quote_enrichment: Optional[bool] = None,
         quote_interval: int = 8,
-        enable_quote_voice_adaptation: bool = True
+        enable_quote_voice_adaptation: bool = True,
+        shared_deps: Optional[Dict[str, Any]] = None
     ):
         # Load configuration
         config = TalksConfig()
         
+        # Heavy components built once by the caller and reused across
+        # orchestrators; currently only "embedding_model" (a SentenceTransformer)
+        shared_deps = shared_deps or {}
+        embedding_model = shared_deps.get("embedding_model")
+        
         self.session_id = f"talks_{uuid.uuid4().hex[:8]}"
         self.topic = topic
         self.target_depth = target_depth
@@ -70,12 +77,13 @@ class MultiAgentDiscussionOrchestrator:
         # Initialize participants
         self.participants = {}
         for config_item in participants_config:
+            spec = config_item if isinstance(config_item, ParticipantSpec) else ParticipantSpec.from_dict(config_item)
             agent = ParticipantAgent(
-                participant_id=config_item["name"].lower().replace(" ", "_"),
-                name=config_item["name"],
-                gender=Gender(config_item["gender"]),
-                personality=PersonalityArchetype(config_item["personality"]),
-                expertise=config_item["expertise"],
+                participant_id=spec.name.lower().replace(" ", "_"),
+                name=spec.name,
+                gender=spec.gender,
+                personality=spec.personality,
+                expertise=spec.expertise,
                 session_id=self.session_id,
                 use_rag_styling=use_rag_styling
             )
@@ -99,6 +107,7 @@ class MultiAgentDiscussionOrchestrator:
         self.first_speaker_id = None  # Store who narrator calls on
         self.narrator_context = ""  # Store narrator's full introduction
         if enable_narrator:
+            from src.agents.narrator_agent import NarratorAgent
             self.narrator = NarratorAgent(
                 name=narrator_name,
                 session_id=self.session_id
@@ -164,8 +173,13 @@ class MultiAgentDiscussionOrchestrator:
         self.max_tension_cycles = max_tension_cycles
         
         if enable_redundancy_control:
+            from src.utils.entailment_detector import EntailmentDetector
+            from src.utils.redundancy_checker import RedundancyChecker
             self.entailment_detector = EntailmentDetector()
-            self.redundancy_checker = RedundancyChecker(similarity_threshold=similarity_threshold)
+            self.redundancy_checker = RedundancyChecker(
+                similarity_threshold=similarity_threshold,
+                model=embedding_model
+            )
             logger.info(f"🔍 Redundancy control enabled (similarity threshold: {similarity_threshold})")
         
         # Progression Control System (optional)
@@ -173,9 +187,11 @@ class MultiAgentDiscussionOrchestrator:
             enable_progression_control = config.get('progression_engine.enabled', True)
         
         self.enable_progression_control = enable_progression_control
-        self.progression_controller = None
+        self._progression_config = None
         
         if enable_progression_control:
+            from src.controllers.progression_controller import ProgressionConfig
+            
             # Create progression config from provided dict or defaults
             if progression_config:
                 prog_config = ProgressionConfig.from_dict(progression_config)
@@ -188,9 +204,8 @@ class MultiAgentDiscussionOrchestrator:
                     enable_progression=True
                 )
             
-            from src.utils.llm_client import LLMClient
-            llm_client = LLMClient()
-            self.progression_controller = ProgressionController(prog_config, llm_client)
+            # The controller (and its LLM client) is built lazily on first use
+            self._progression_config = prog_config
             logger.info(f"🚀 Progression control enabled (cycles: {prog_config.cycles_threshold}, tests: {prog_config.max_consequence_tests})")
         
         # Quote Enrichment System (optional)
@@ -201,10 +216,12 @@ class MultiAgentDiscussionOrchestrator:
         self.quote_agent = None
         
         if enable_quote_enrichment:
+            from src.agents.quote_enrichment_agent import QuoteEnrichmentAgent
             self.quote_agent = QuoteEnrichmentAgent(
                 quote_interval=quote_interval,
                 enable_voice_adaptation=enable_quote_voice_adaptation,
-                session_id=self.session_id
+                session_id=self.session_id,
+                embedding_model=embedding_model
             )
             logger.info(f"📚 Quote enrichment enabled (interval={quote_interval})")
         
@@ -216,6 +233,16 @@ class MultiAgentDiscussionOrchestrator:
         self._log_filepath = outputs_dir / f"conversation_{self.session_id}_{timestamp}.md"
         self._log_task = None
     
+    @cached_property
+    def progression_controller(self) -> Optional['ProgressionController']:
+        """Progression controller, constructed on first access"""
+        if self._progression_config is None:
+            return None
+        
+        from src.controllers.progression_controller import ProgressionController
+        from src.utils.llm_client import LLMClient
+        return ProgressionController(self._progression_config, LLMClient())
+    
     async def run_introduction(self) -> List[Dict[str, str]]:
         """Generate and return narrator introduction segments"""
         if not self.narrator:
@@ -455,7 +482,14 @@ class MultiAgentDiscussionOrchestrator:
             tension.reset()
     
     async def run_discussion(self, max_iterations: int = 30) -> List[Dict]:
-        """Main discussion loop with optional narrator introduction"""
+        """Run the full discussion and return all exchanges"""
+        async for _ in self.stream_discussion(max_iterations=max_iterations):
+            pass
+        
+        return self.group_state.exchanges
+    
+    async def stream_discussion(self, max_iterations: int = 30) -> AsyncIterator[Dict]:
+        """Main discussion loop with optional narrator introduction, yielding each exchange as it completes"""
         
         logger.info(f"🎭 Starting {len(self.participants)}-person discussion")
         logger.info(f"📖 Topic: {self.topic}")
@@ -470,6 +504,10 @@ class MultiAgentDiscussionOrchestrator:
         # Start logging
         await self._start_logging()
         
+        # Every exchange added to the group state is yielded, including the
+        # pivot dilemmas and the coda that are added outside the turn loop
+        emitted = len(self.group_state.exchanges)
+        
         try:
             # Run narrator introduction if enabled
             if self.enable_narrator:
@@ -480,6 +518,9 @@ class MultiAgentDiscussionOrchestrator:
                 # Check for forced pivot before selecting speaker
                 if self._should_force_pivot():
                     await self._execute_forced_pivot()
+                    for exchange in self.group_state.exchanges[emitted:]:
+                        yield exchange
+                    emitted = len(self.group_state.exchanges)
                     # Continue to next iteration with fresh state
                     continue
                 
@@ -690,6 +731,10 @@ class MultiAgentDiscussionOrchestrator:
                 # Update addressing flags
                 self._update_addressing(recommended_move)
                 
+                for exchange in self.group_state.exchanges[emitted:]:
+                    yield exchange
+                emitted = len(self.group_state.exchanges)
+                
                 # Check basic termination (for now)
                 if self._should_terminate_basic():
                     logger.info("\n✅ Discussion complete")
@@ -698,6 +743,9 @@ class MultiAgentDiscussionOrchestrator:
             # GENERATE COGNITIVE CODA
             if self.enable_coda and self.coda_agent:
                 await self._generate_cognitive_coda()
+                for exchange in self.group_state.exchanges[emitted:]:
+                    yield exchange
+                emitted = len(self.group_state.exchanges)
         
             # LOG AGGREGATE METRICS
             if self.enable_strategic_scoring and self.strategic_coordinator:
@@ -731,8 +779,6 @@ class MultiAgentDiscussionOrchestrator:
         finally:
             # Stop logging
             await self._stop_logging()
-        
-        return self.group_state.exchanges
     
     async def _update_group_state(self, response: str, speaker: ParticipantState):
         """Update group-level state after each turn"""
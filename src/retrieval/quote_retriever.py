@@ -3,6 +3,7 @@
 import json
 import logging
 import random
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import List, Dict, Optional, Set, Tuple
 import numpy as np
@@ -23,12 +24,19 @@ class QuoteRetriever:
     Retrieves philosophically relevant quotes using hybrid keyword + semantic search
     """
     
-    def __init__(self, corpus_path: str = "data/philosophical_quotes.jsonl"):
+    def __init__(
+        self,
+        corpus_path: str = "data/philosophical_quotes.jsonl",
+        quotes: Optional[List[Dict]] = None,
+        embedding_model=None
+    ):
         """
         Initialize quote retriever
         
         Args:
             corpus_path: Path to JSONL corpus file
+            quotes: Already-parsed corpus; when given, corpus_path is not read
+            embedding_model: Preloaded sentence transformer to reuse instead of loading one
         """
         self.corpus_path = Path(corpus_path)
         self.quotes: List[Dict] = []
@@ -37,8 +45,23 @@ class QuoteRetriever:
         # Semantic search model (optional)
         self.embedding_model = None
         self.quote_embeddings: Optional[np.ndarray] = None
-        
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
+        self._unit_embeddings: Optional[np.ndarray] = None  # L2-normalized float32 rows
+        
+        # Per-field columns parallel to self.quotes, built once at load time
+        self._quote_rows: Dict[str, int] = {}  # id -> row
+        self._topic_sets: List[frozenset] = []  # lowercased topics
+        self._texts_lower: List[str] = []
+        self._authors: List[str] = []
+        self._eras: List[str] = []
+        self._traditions: List[str] = []
+        self._query_embeddings: Dict[str, np.ndarray] = {}  # query -> embedding
+        self._topic_rows: Dict[str, np.ndarray] = {}  # lowercased topic -> rows tagged with it
+        self._term_masks: Dict[str, np.ndarray] = {}  # search term -> rows whose text contains it
+        
+        if embedding_model is not None:
+            self.embedding_model = embedding_model
+            logger.info("📊 Semantic search enabled with shared sentence transformer")
+        elif SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
                 self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
                 logger.info("📊 Semantic search enabled with sentence transformers")
@@ -52,7 +75,13 @@ class QuoteRetriever:
         self.author_usage: Dict[str, int] = {}
         
         # Load corpus
-        self._load_corpus()
+        if quotes is not None:
+            self.quotes = list(quotes)
+            self.quote_index = {quote['id']: quote for quote in self.quotes}
+        else:
+            self._load_corpus()
+        self._build_columns()
+        self._precompute_embeddings()
         logger.info(f"📚 QuoteRetriever initialized with {len(self.quotes)} quotes")
     
     def _load_corpus(self):
@@ -67,16 +96,39 @@ class QuoteRetriever:
                     quote = json.loads(line.strip())
                     self.quotes.append(quote)
                     self.quote_index[quote['id']] = quote
-        
-        # Precompute embeddings for all quotes if model available
+    
+    def _build_columns(self):
+        """Split the fields used for filtering and statistics into parallel columns"""
+        self._quote_rows = {q['id']: i for i, q in enumerate(self.quotes)}
+        self._topic_sets = [frozenset(t.lower() for t in q['topics']) for q in self.quotes]
+        self._texts_lower = [q['quote'].lower() for q in self.quotes]
+        self._authors = [q['author'] for q in self.quotes]
+        self._eras = [q['era'] for q in self.quotes]
+        self._traditions = [q['tradition'] for q in self.quotes]
+        
+        topic_rows = defaultdict(list)
+        for i, quote_topics in enumerate(self._topic_sets):
+            for topic in quote_topics:
+                topic_rows[topic].append(i)
+        self._topic_rows = {topic: np.array(rows, dtype=np.intp) for topic, rows in topic_rows.items()}
+        self._term_masks = {}
+    
+    def _precompute_embeddings(self):
+        """Precompute embeddings for all quotes if model available"""
         if self.quotes and self.embedding_model:
             try:
                 quote_texts = [q['quote'] for q in self.quotes]
                 self.quote_embeddings = self.embedding_model.encode(quote_texts)
+                
+                # Normalize once so ranking is a single matrix-vector product
+                embeddings = np.ascontiguousarray(self.quote_embeddings, dtype=np.float32)
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                self._unit_embeddings = embeddings / np.where(norms == 0, 1, norms)
                 logger.info(f"📊 Precomputed embeddings for {len(quote_texts)} quotes")
             except Exception as e:
                 logger.warning(f"Failed to compute embeddings: {e}")
                 self.quote_embeddings = None
+                self._unit_embeddings = None
     
     def retrieve(
         self,
@@ -85,7 +137,8 @@ class QuoteRetriever:
         exclude_authors: Optional[List[str]] = None,
         top_k: int = 3,
         diversity_weight: float = 0.3,
-        relevance_threshold: float = 0.65
+        relevance_threshold: float = 0.65,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict]:
         """
         Retrieve relevant quotes using hybrid search
@@ -97,6 +150,7 @@ class QuoteRetriever:
             top_k: Number of quotes to return
             diversity_weight: Weight for diversity vs pure relevance (0-1)
             relevance_threshold: Minimum semantic similarity score
+            query_embedding: Precomputed embedding from embed_topics()
             
         Returns:
             List of quote dictionaries with relevance scores
@@ -114,7 +168,7 @@ class QuoteRetriever:
         
         # Step 2: Semantic ranking (if available) or fallback to keyword scoring
         if self.embedding_model and self.quote_embeddings is not None:
-            ranked_quotes = self._semantic_rank(query, keyword_candidates, relevance_threshold)
+            ranked_quotes = self._semantic_rank(query, keyword_candidates, relevance_threshold, query_embedding)
         else:
             ranked_quotes = self._keyword_rank(keyword_candidates, topics, current_tension)
         
@@ -151,6 +205,76 @@ class QuoteRetriever:
         
         return " ".join(query_parts)
     
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Encode a search query, reusing the embedding for repeated queries"""
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            embedding = self.embedding_model.encode(query)
+            self._cache_query_embedding(query, embedding)
+        return embedding
+    
+    def _cache_query_embedding(self, query: str, embedding: np.ndarray):
+        """Store a query embedding, dropping the oldest entry to keep the cache bounded"""
+        if len(self._query_embeddings) >= 128:
+            self._query_embeddings.pop(next(iter(self._query_embeddings)))
+        self._query_embeddings[query] = embedding
+    
+    def embed_search_queries(self, queries: List[str]):
+        """Encode search_quotes() queries in one batch so the searches reuse the embeddings"""
+        if not self.embedding_model:
+            return
+        
+        built = [self._build_query(query.lower().split()) for query in queries]
+        missing = [query for query in dict.fromkeys(built) if query not in self._query_embeddings]
+        if missing:
+            for query, embedding in zip(missing, self.embedding_model.encode(missing)):
+                self._cache_query_embedding(query, embedding)
+    
+    def embed_topics(
+        self,
+        topics: List[str],
+        tension: Optional[Tuple[str, str]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Embed discussion topics once so repeated retrievals can reuse them
+        
+        Returns:
+            Query embedding, or None when semantic search is unavailable
+        """
+        if not self.embedding_model:
+            return None
+        return self._embed_query(self._build_query(list(topics), tension))
+    
+    def _text_mask(self, term: str) -> np.ndarray:
+        """Boolean row mask of quotes whose text contains term, cached per term"""
+        mask = self._term_masks.get(term)
+        if mask is None:
+            mask = np.fromiter((term in text for text in self._texts_lower), dtype=bool, count=len(self._texts_lower))
+            if len(self._term_masks) >= 4096:
+                # Drop the oldest entry to keep the cache bounded
+                self._term_masks.pop(next(iter(self._term_masks)))
+            self._term_masks[term] = mask
+        return mask
+    
+    def _match_counts(self, search_terms: Set[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-row match counts over the whole corpus
+        
+        Returns:
+            (topic_overlap, text_matches): how many search terms are among each
+            quote's topics, and how many occur as substrings of its text
+        """
+        topic_overlap = np.zeros(len(self.quotes), dtype=np.int64)
+        text_matches = np.zeros(len(self.quotes), dtype=np.int64)
+        
+        for term in search_terms:
+            rows = self._topic_rows.get(term)
+            if rows is not None:
+                topic_overlap[rows] += 1
+            text_matches += self._text_mask(term)
+        
+        return topic_overlap, text_matches
+    
     def _keyword_filter(
         self,
         topics: List[str],
@@ -163,18 +287,10 @@ class QuoteRetriever:
         if tension:
             search_terms.update(t.lower() for t in tension)
         
-        for quote in self.quotes:
-            # Check if any search term matches quote topics
-            quote_topics = set(t.lower() for t in quote['topics'])
-            
-            # Exact match or partial match
-            if search_terms & quote_topics:  # Intersection
-                candidates.append(quote)
-            else:
-                # Also check for partial matches in quote text or topics
-                quote_text_lower = quote['quote'].lower()
-                if any(term in quote_text_lower for term in search_terms):
-                    candidates.append(quote)
+        # Exact topic match, or partial match in the quote text
+        topic_overlap, text_matches = self._match_counts(search_terms)
+        for row in np.flatnonzero(topic_overlap | text_matches):
+            candidates.append(self.quotes[row])
         
         # If too few, return all quotes
         if len(candidates) < 5:
@@ -188,7 +304,8 @@ class QuoteRetriever:
         self,
         query: str,
         candidates: List[Dict],
-        threshold: float
+        threshold: float,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict]:
         """Rank candidates by semantic similarity"""
         if not candidates:
@@ -196,27 +313,27 @@ class QuoteRetriever:
         
         try:
             # Get query embedding
-            query_embedding = self.embedding_model.encode(query)
+            if query_embedding is None:
+                query_embedding = self._embed_query(query)
             
-            # Get candidate indices
-            candidate_indices = [self.quotes.index(c) for c in candidates]
-            candidate_embeddings = self.quote_embeddings[candidate_indices]
+            # Get candidate rows
+            candidate_rows = [self._quote_rows[c['id']] for c in candidates]
+            candidate_embeddings = self._unit_embeddings[candidate_rows]
             
-            # Compute cosine similarities
-            similarities = np.dot(candidate_embeddings, query_embedding) / (
-                np.linalg.norm(candidate_embeddings, axis=1) * np.linalg.norm(query_embedding)
-            )
+            # Compute cosine similarities against the pre-normalized rows
+            query_vector = np.asarray(query_embedding, dtype=np.float32)
+            similarities = candidate_embeddings @ (query_vector / np.linalg.norm(query_vector))
             
-            # Attach scores and filter by threshold
-            ranked = []
-            for idx, sim in enumerate(similarities):
-                if sim >= threshold:
-                    quote = candidates[idx].copy()
-                    quote['relevance_score'] = float(sim)
-                    ranked.append(quote)
+            # Filter by threshold and sort by relevance (stable, like list.sort)
+            above = np.flatnonzero(similarities >= threshold)
+            order = above[np.argsort(-similarities[above], kind='stable')]
             
-            # Sort by relevance
-            ranked.sort(key=lambda x: x['relevance_score'], reverse=True)
+            # Attach scores
+            ranked = []
+            for idx in order:
+                quote = candidates[idx].copy()
+                quote['relevance_score'] = float(similarities[idx])
+                ranked.append(quote)
             
             logger.debug(f"Semantic ranking: {len(ranked)} quotes above threshold")
             return ranked
@@ -236,27 +353,18 @@ class QuoteRetriever:
         if tension:
             search_terms.update(t.lower() for t in tension)
         
-        ranked = []
-        for quote in candidates:
-            # Score based on topic overlap
-            quote_topics = set(t.lower() for t in quote['topics'])
-            overlap = len(search_terms & quote_topics)
-            
-            # Bonus for exact matches in quote text
-            quote_text_lower = quote['quote'].lower()
-            text_matches = sum(1 for term in search_terms if term in quote_text_lower)
-            
-            # Simple relevance score
-            relevance_score = (overlap * 0.7 + text_matches * 0.3) / max(len(search_terms), 1)
-            
-            # Only include if some relevance
-            if relevance_score > 0:
-                quote_copy = quote.copy()
-                quote_copy['relevance_score'] = relevance_score
-                ranked.append(quote_copy)
+        # Score based on topic overlap, with a bonus for matches in quote text
+        topic_overlap, text_matches = self._match_counts(search_terms)
+        rows = np.fromiter((self._quote_rows[quote['id']] for quote in candidates), dtype=np.intp, count=len(candidates))
+        scores = (topic_overlap[rows] * 0.7 + text_matches[rows] * 0.3) / max(len(search_terms), 1)
         
-        # Sort by relevance
-        ranked.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Only include if some relevance, sorted by relevance (stable, like list.sort)
+        relevant = np.flatnonzero(scores > 0)
+        ranked = []
+        for idx in relevant[np.argsort(-scores[relevant], kind='stable')]:
+            quote_copy = candidates[idx].copy()
+            quote_copy['relevance_score'] = float(scores[idx])
+            ranked.append(quote_copy)
         
         logger.debug(f"Keyword ranking: {len(ranked)} quotes with relevance")
         return ranked
@@ -308,29 +416,20 @@ class QuoteRetriever:
     
     def get_quotes_by_author(self, author: str) -> List[Dict]:
         """Get all quotes by a specific author"""
-        return [q for q in self.quotes if q['author'] == author]
+        return [q for q, a in zip(self.quotes, self._authors) if a == author]
     
     def get_quotes_by_era(self, era: str) -> List[Dict]:
         """Get all quotes from a specific era"""
-        return [q for q in self.quotes if q['era'] == era]
+        return [q for q, e in zip(self.quotes, self._eras) if e == era]
     
     def get_statistics(self) -> Dict:
         """Get usage statistics"""
-        era_distribution = {}
-        tradition_distribution = {}
-        
-        for quote in self.quotes:
-            era = quote['era']
-            tradition = quote['tradition']
-            era_distribution[era] = era_distribution.get(era, 0) + 1
-            tradition_distribution[tradition] = tradition_distribution.get(tradition, 0) + 1
-        
         return {
             'total_quotes': len(self.quotes),
             'quotes_used': len(self.used_quotes),
-            'unique_authors': len(set(q['author'] for q in self.quotes)),
-            'era_distribution': era_distribution,
-            'tradition_distribution': tradition_distribution,
+            'unique_authors': len(set(self._authors)),
+            'era_distribution': dict(Counter(self._eras)),
+            'tradition_distribution': dict(Counter(self._traditions)),
             'author_usage': self.author_usage.copy(),
             'recent_authors': self.last_authors[-5:],
             'semantic_search_enabled': self.embedding_model is not None
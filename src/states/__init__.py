@@ -1,4 +1,4 @@
-from .participant_state import ParticipantState, Gender, PersonalityArchetype
+from .participant_state import ParticipantState, ParticipantSpec, Gender, PersonalityArchetype
 from .group_state import GroupDiscussionState
 
-__all__ = ['ParticipantState', 'Gender', 'PersonalityArchetype', 'GroupDiscussionState']
\ No newline at end of file
+__all__ = ['ParticipantState', 'ParticipantSpec', 'Gender', 'PersonalityArchetype', 'GroupDiscussionState']
\ No newline at end of file
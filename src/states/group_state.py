@@ -5,7 +5,7 @@ from .dyad_state import DyadState
 from .tension_state import TensionState
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDiscussionState:
     """Global state for the entire group discussion"""
     
@@ -21,7 +21,27 @@ class PersonalityArchetype(Enum):
     SKEPTICAL = "skeptical"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ParticipantSpec:
+    """Immutable participant configuration with enums already resolved"""
+    
+    name: str
+    gender: Gender
+    personality: PersonalityArchetype
+    expertise: str
+    
+    @classmethod
+    def from_dict(cls, config: Dict) -> 'ParticipantSpec':
+        """Build a spec from a participant config dict (string or enum values)"""
+        return cls(
+            name=config["name"],
+            gender=Gender(config["gender"]),
+            personality=PersonalityArchetype(config["personality"]),
+            expertise=config["expertise"]
+        )
+
+
+@dataclass(slots=True)
 class ParticipantState:
     """State for each discussion participant"""
     
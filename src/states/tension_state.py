@@ -30,6 +30,8 @@ class TensionState:
     needs_pivot: bool = False
     
     def __post_init__(self):
+        # Canonicalize once so callers can key tension dicts on ``pair`` directly
+        self.pair = tuple(sorted(self.pair))
         if self.consequence_tests is None:
             self.consequence_tests = []
     
@@ -73,8 +75,12 @@ class TensionState:
     
     def count_failed_tests(self, window: int = 8) -> int:
         """Count consequence tests that didn't produce new entailments"""
-        recent_tests = self.get_recent_tests(window)
-        return sum(1 for test in recent_tests if test.responded and not test.had_entailment)
+        # Single pass without materializing the recent-test list; outcomes are
+        # set directly on ConsequenceTest objects, so a running counter would
+        # miss updates and could not honour the window
+        cutoff = max(0, self.last_consequence_turn - window)
+        return sum(1 for test in self.consequence_tests
+                   if test.turn >= cutoff and test.responded and not test.had_entailment)
     
     def should_inject_test(self) -> bool:
         """Check if a consequence test should be injected"""
@@ -128,18 +128,18 @@ class EntailmentDetector:
         ]
     }
     
+    # One alternation per type, so a single search tells whether any of its
+    # patterns match (patterns of different types can overlap, e.g. "therefore"
+    # and "therefore we should", so types are not merged into one regex)
+    _TYPE_REGEXES = {
+        ent_type: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+        for ent_type, patterns in PATTERNS.items()
+    }
+    
     def detect(self, text: str) -> Set[EntailmentType]:
         """Detect entailment types in text"""
         text_lower = text.lower()
-        found = set()
-        
-        for ent_type, patterns in self.PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    found.add(ent_type)
-                    break
-        
-        return found
+        return {ent_type for ent_type, regex in self._TYPE_REGEXES.items() if regex.search(text_lower)}
     
     def has_entailment(self, text: str) -> bool:
         """Check if text has any entailment"""
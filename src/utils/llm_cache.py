@@ -0,0 +1,91 @@
+"""Persistent exact-match cache for LangChain chat model responses"""
+
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.globals import set_llm_cache
+from langchain_core.load import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentLLMCache(BaseCache):
+    """
+    LLM response cache stored in a local SQLite file
+    
+    Entries are keyed by the serialized prompt plus the model's llm_string
+    (model name, temperature, bound tools), so any change to either is a miss.
+    Async lookups run inline on the event loop: they are single-row queries on
+    a local file, and keeping them on one thread avoids the write races that
+    executor-backed caches hit when several discussions run concurrently.
+    """
+    
+    def __init__(self, database_path: str = "outputs/.llm_cache.db"):
+        self.database_path = Path(database_path)
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "prompt TEXT NOT NULL, llm_string TEXT NOT NULL, generations TEXT NOT NULL, "
+            "PRIMARY KEY (prompt, llm_string))"
+        )
+        self._conn.commit()
+    
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations for a prompt, or None on a miss"""
+        row = self._conn.execute(
+            "SELECT generations FROM llm_cache WHERE prompt = ? AND llm_string = ?",
+            (prompt, llm_string)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        try:
+            return [loads(generation) for generation in json.loads(row[0])]
+        except Exception as e:
+            logger.warning(f"Discarding unreadable LLM cache entry: {e}")
+            return None
+    
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations for a prompt"""
+        generations = json.dumps([dumps(generation) for generation in return_val])
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (prompt, llm_string, generations) VALUES (?, ?, ?)",
+            (prompt, llm_string, generations)
+        )
+        self._conn.commit()
+    
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all cached responses"""
+        self._conn.execute("DELETE FROM llm_cache")
+        self._conn.commit()
+    
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+    
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.update(prompt, llm_string, return_val)
+    
+    async def aclear(self, **kwargs: Any) -> None:
+        self.clear(**kwargs)
+
+
+def enable_llm_cache(database_path: str = "outputs/.llm_cache.db") -> PersistentLLMCache:
+    """Install a PersistentLLMCache as the global cache for all LangChain models"""
+    cache = PersistentLLMCache(database_path)
+    set_llm_cache(cache)
+    logger.info(f"💾 LLM response cache enabled at {cache.database_path}")
+    return cache
+
+
+def enable_test_llm_cache() -> Optional[PersistentLLMCache]:
+    """Cache LLM responses for test reruns when TEST_LLM_CACHE=1; otherwise every call hits the LLM"""
+    if os.getenv("TEST_LLM_CACHE") != "1":
+        return None
+    return enable_llm_cache("outputs/.test_llm_cache.db")
@@ -1,11 +1,38 @@
 """Simple LLM client wrapper for progression control components"""
 
+import asyncio
 import os
+import weakref
 from typing import Optional, Dict, Any
+import httpx
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage
 from .text_processing import strip_reasoning
 
+# One connection pool per event loop, shared by every Ollama chat model built
+# on that loop; pooled connections can't outlive or cross loops
+_shared_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = weakref.WeakKeyDictionary()
+
+
+def shared_async_client_kwargs() -> Dict[str, Any]:
+    """
+    ChatOllama async_client_kwargs that reuse the running loop's connection pool
+    
+    Returns an empty dict (a private pool per model) when no loop is running.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return {}
+    
+    transport = _shared_transports.get(loop)
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=64, keepalive_expiry=60)
+        )
+        _shared_transports[loop] = transport
+    return {"transport": transport}
+
 
 class LLMClient:
     """Simple LLM client for generating consequence tests and synthesis"""
@@ -22,7 +49,8 @@ class LLMClient:
         self.clean_responses = clean_responses
         self.llm = ChatOllama(
             model=self.model,
-            temperature=temperature
+            temperature=temperature,
+            async_client_kwargs=shared_async_client_kwargs()
         )
     
     async def complete(self, prompt: str) -> str:
@@ -7,10 +7,14 @@ logger = logging.getLogger(__name__)
 class RedundancyChecker:
     """Checks for semantic similarity to detect redundant content"""
     
-    def __init__(self, similarity_threshold: float = 0.85):
+    # Recent turns are re-checked every turn, so keep their embeddings around
+    EMBEDDING_CACHE_SIZE = 256
+    
+    def __init__(self, similarity_threshold: float = 0.85, model=None):
         self.threshold = similarity_threshold
-        self.model = None
+        self.model = model  # Optional preloaded sentence transformer
         self._initialized = False
+        self._embedding_cache = {}  # text -> unit-length embedding
     
     def _initialize_model(self):
         """Lazy initialization of sentence transformer model"""
@@ -18,9 +22,10 @@ class RedundancyChecker:
             return
         
         try:
-            from sentence_transformers import SentenceTransformer
             import numpy as np
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            if self.model is None:
+                from sentence_transformers import SentenceTransformer
+                self.model = SentenceTransformer('all-MiniLM-L6-v2')
             self.np = np
             self._initialized = True
             logger.debug("Sentence transformer model initialized successfully")
@@ -42,16 +47,7 @@ class RedundancyChecker:
             return self._fallback_similarity_check(candidate, recent_texts)
         
         try:
-            embeddings = self.model.encode([candidate] + recent_texts)
-            candidate_emb = embeddings[0]
-            recent_embs = embeddings[1:]
-            
-            similarities = self.np.dot(recent_embs, candidate_emb) / (
-                self.np.linalg.norm(recent_embs, axis=1) * self.np.linalg.norm(candidate_emb)
-            )
-            
-            max_similarity = self.np.max(similarities)
-            return max_similarity >= self.threshold
+            return self._semantic_max_similarity(candidate, recent_texts) >= self.threshold
         except Exception as e:
             logger.error(f"Error in semantic similarity check: {e}")
             return self._fallback_similarity_check(candidate, recent_texts)
@@ -67,19 +63,33 @@ class RedundancyChecker:
             return self._fallback_max_similarity(candidate, recent_texts)
         
         try:
-            embeddings = self.model.encode([candidate] + recent_texts)
-            candidate_emb = embeddings[0]
-            recent_embs = embeddings[1:]
-            
-            similarities = self.np.dot(recent_embs, candidate_emb) / (
-                self.np.linalg.norm(recent_embs, axis=1) * self.np.linalg.norm(candidate_emb)
-            )
-            
-            return float(self.np.max(similarities))
+            return self._semantic_max_similarity(candidate, recent_texts)
         except Exception as e:
             logger.error(f"Error in similarity calculation: {e}")
             return self._fallback_max_similarity(candidate, recent_texts)
     
+    def _semantic_max_similarity(self, candidate: str, recent_texts: List[str]) -> float:
+        """Max cosine similarity, encoding only texts not seen in earlier checks"""
+        texts = [candidate] + recent_texts
+        
+        missing = [text for text in dict.fromkeys(texts) if text not in self._embedding_cache]
+        if missing:
+            embeddings = self.np.asarray(self.model.encode(missing), dtype=self.np.float32)
+            norms = self.np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= self.np.where(norms == 0, 1, norms)
+            self._embedding_cache.update(zip(missing, embeddings))
+        
+        candidate_emb = self._embedding_cache[candidate]
+        recent_embs = self.np.stack([self._embedding_cache[text] for text in recent_texts])
+        
+        # Evict the oldest entries once the working set has been read
+        excess = len(self._embedding_cache) - self.EMBEDDING_CACHE_SIZE
+        for text in list(self._embedding_cache)[:max(excess, 0)]:
+            del self._embedding_cache[text]
+        
+        # Rows are unit length, so cosine similarity is a single dot product
+        return float(self.np.max(recent_embs @ candidate_emb))
+    
     def _fallback_similarity_check(self, candidate: str, recent_texts: List[str]) -> bool:
         """Simple word overlap fallback when sentence transformers unavailable"""
         candidate_words = set(candidate.lower().split())
@@ -1,4 +1,46 @@
 import re
+from functools import lru_cache
+
+
+# Patterns are compiled once at import; these helpers run on every LLM response
+_THINK_BLOCK_RE = re.compile(r'<think\s*>.*?</think\s*>', re.DOTALL | re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+_MULTI_SPACE_RE = re.compile(r'  +')
+_NEWLINE_BEFORE_QUOTE_RE = re.compile(r'\n\s*"')
+_NEWLINE_AFTER_QUOTE_RE = re.compile(r'"\s*\n')
+
+# Response prefixes are stripped in this order, so stacked prefixes
+# ("Response: Quote: ...") are all removed
+_RESPONSE_PREFIX_RES = tuple(
+    re.compile(rf'^\s*{prefix}', re.IGNORECASE)
+    for prefix in (
+        r'adapted\s+quote\s*:\s*',
+        r'response\s*:\s*',
+        r'quote\s*:\s*',
+        r'output\s*:\s*',
+        r'result\s*:\s*',
+        r'answer\s*:\s*'
+    )
+)
+
+_TRAILING_PAREN_NOTE_RE = re.compile(r'\s*\([^)]*\)\s*$')
+_TRAILING_BRACKET_NOTE_RE = re.compile(r'\s*\[[^\]]*\]\s*$')
+_ASTERISK_NOTE_RE = re.compile(r'\s*\*\([^)]*\)\*\s*')
+_SMART_QUOTE_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # Curly double quotes
+    '\u2018': "'", '\u2019': "'"   # Curly single quotes / apostrophe
+})
+_QUOTE_SPACING_RE = re.compile(r'\s*"\s*')
+_EM_DASH_RE = re.compile(r'\s*—\s*')
+_HYPHEN_ATTRIBUTION_RE = re.compile(r'\s*-\s*([A-Z][a-zA-Z\s]+)$')
+
+# Quote extraction patterns, tried in order:
+# "quote text" — Author Name (stopping at punctuation or new clause)
+_QUOTE_EM_DASH_RE = re.compile(r'"([^"]+)"\s*—\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n|$))')
+# Simpler pattern that captures up to common stop words
+_QUOTE_EM_DASH_SIMPLE_RE = re.compile(r'"([^"]+)"\s*—\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n)|\s*$)')
+# "quote text" - Author Name (with hyphen)
+_QUOTE_HYPHEN_RE = re.compile(r'"([^"]+)"\s*-\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n)|\s*$)')
 
 
 def strip_reasoning(text: str) -> str:
@@ -16,18 +58,15 @@ def strip_reasoning(text: str) -> str:
     if not text:
         return text
     
-    # Pattern to match <think>...</think> blocks (case-insensitive, with optional whitespace)
-    # Using DOTALL flag to match across newlines
-    pattern = r'<think\s*>.*?</think\s*>'
-    
-    # Remove the reasoning blocks and any extra whitespace they leave behind
-    cleaned = re.sub(pattern, '', text, flags=re.DOTALL | re.IGNORECASE)
+    # Remove the <think>...</think> blocks and any extra whitespace they leave behind
+    cleaned = _THINK_BLOCK_RE.sub('', text)
     
     # Clean up any resulting multiple newlines and extra whitespace
-    cleaned = re.sub(r'\n\s*\n+', '\n', cleaned)  # Multiple newlines to single
-    cleaned = re.sub(r'  +', ' ', cleaned)        # Multiple spaces to single
-    cleaned = re.sub(r'\n\s*"', '"', cleaned)     # Newline before quote
-    cleaned = re.sub(r'"\s*\n', '"', cleaned)     # Newline after quote
+    cleaned = _BLANK_LINES_RE.sub('\n', cleaned)          # Multiple newlines to single
+    if '  ' in cleaned:
+        cleaned = _MULTI_SPACE_RE.sub(' ', cleaned)       # Multiple spaces to single
+    cleaned = _NEWLINE_BEFORE_QUOTE_RE.sub('"', cleaned)  # Newline before quote
+    cleaned = _NEWLINE_AFTER_QUOTE_RE.sub('"', cleaned)   # Newline after quote
     
     return cleaned.strip()
 
@@ -47,21 +86,12 @@ def strip_response_prefixes(text: str) -> str:
     if not text:
         return text
     
-    # Common prefixes to remove (case-insensitive)
-    prefixes = [
-        r'adapted\s+quote\s*:\s*',
-        r'response\s*:\s*',
-        r'quote\s*:\s*',
-        r'output\s*:\s*',
-        r'result\s*:\s*',
-        r'answer\s*:\s*'
-    ]
-    
+    # Every prefix ends in a colon, so most responses skip the patterns entirely
     cleaned = text
-    for prefix in prefixes:
-        # Remove prefix at start of text (case-insensitive)
-        pattern = rf'^\s*{prefix}'
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    if ':' in cleaned:
+        for prefix in _RESPONSE_PREFIX_RES:
+            # Remove prefix at start of text (case-insensitive)
+            cleaned = prefix.sub('', cleaned)
     
     return cleaned.strip()
 
@@ -83,28 +113,34 @@ def clean_quote_formatting(text: str) -> str:
     
     cleaned = text
     
+    # Patterns that open with \s* are retried at every position of the text,
+    # so each one only runs when the character it needs is actually present
+    
     # Remove explanatory text in parentheses or brackets at the end
-    cleaned = re.sub(r'\s*\([^)]*\)\s*$', '', cleaned)
-    cleaned = re.sub(r'\s*\[[^\]]*\]\s*$', '', cleaned)
+    if ')' in cleaned:
+        cleaned = _TRAILING_PAREN_NOTE_RE.sub('', cleaned)
+    if ']' in cleaned:
+        cleaned = _TRAILING_BRACKET_NOTE_RE.sub('', cleaned)
     
     # Remove asterisked explanations like *(Note: ...)*
-    cleaned = re.sub(r'\s*\*\([^)]*\)\*\s*', '', cleaned)
+    if '*(' in cleaned:
+        cleaned = _ASTERISK_NOTE_RE.sub('', cleaned)
     
     # Clean up multiple quote marks and normalize
-    cleaned = re.sub(r'["""]', '"', cleaned)  # Normalize smart quotes
-    cleaned = re.sub(r"['']", "'", cleaned)   # Normalize smart apostrophes
+    cleaned = cleaned.translate(_SMART_QUOTE_TABLE)  # Normalize smart quotes and apostrophes
     
     # Remove extra whitespace around quotes
-    cleaned = re.sub(r'\s*"\s*', '"', cleaned)
+    if '"' in cleaned:
+        cleaned = _QUOTE_SPACING_RE.sub('"', cleaned)
     
     # Normalize attribution format (ensure proper spacing around em dash)
-    cleaned = re.sub(r'\s*—\s*', ' — ', cleaned)
-    cleaned = re.sub(r'\s*-\s*([A-Z][a-zA-Z\s]+)$', r' — \1', cleaned)
-    
-    # Clean up extra whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    if '—' in cleaned:
+        cleaned = _EM_DASH_RE.sub(' — ', cleaned)
+    if '-' in cleaned:
+        cleaned = _HYPHEN_ATTRIBUTION_RE.sub(r' — \1', cleaned)
     
-    return cleaned.strip()
+    # Collapse whitespace runs (split() uses the same Unicode whitespace as \s)
+    return ' '.join(cleaned.split())
 
 
 def extract_quote_pattern(text: str) -> str:
@@ -122,42 +158,25 @@ def extract_quote_pattern(text: str) -> str:
     if not text:
         return text
     
-    # Pattern to match: "quote text" — Author Name (stopping at punctuation or new clause)
-    quote_pattern = r'"([^"]+)"\s*—\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n|$))'
-    match = re.search(quote_pattern, text)
-    
-    if match:
-        quote_text = match.group(1).strip()
-        author = match.group(2).strip()
-        return f'"{quote_text}" — {author}'
-    
-    # Fallback: simpler pattern that captures up to common stop words
-    quote_pattern_simple = r'"([^"]+)"\s*—\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n)|\s*$)'
-    match = re.search(quote_pattern_simple, text)
-    
-    if match:
-        quote_text = match.group(1).strip()
-        author = match.group(2).strip()
-        return f'"{quote_text}" — {author}'
-    
-    # Pattern to match: "quote text" - Author Name (with hyphen)
-    quote_pattern_hyphen = r'"([^"]+)"\s*-\s*([A-Z][a-zA-Z\s.]+?)(?:\s+(?:and|but|or|,|\.|\n)|\s*$)'
-    match = re.search(quote_pattern_hyphen, text)
-    
-    if match:
-        quote_text = match.group(1).strip()
-        author = match.group(2).strip()
-        return f'"{quote_text}" — {author}'
+    for pattern in (_QUOTE_EM_DASH_RE, _QUOTE_EM_DASH_SIMPLE_RE, _QUOTE_HYPHEN_RE):
+        match = pattern.search(text)
+        if match:
+            quote_text = match.group(1).strip()
+            author = match.group(2).strip()
+            return f'"{quote_text}" — {author}'
     
     # If no clear pattern, return original text
     return text
 
 
+@lru_cache(maxsize=256)
 def clean_llm_response(text: str, is_quote: bool = False) -> str:
     """
     Comprehensive LLM response cleaning pipeline.
     
-    Applies all cleaning operations in the correct order.
+    Applies all cleaning operations in the correct order. The result depends
+    only on the arguments, so repeated responses (retries, replayed LLM cache
+    hits) are served from an LRU cache; see cache_info() / cache_clear().
     
     Args:
         text: The raw LLM response
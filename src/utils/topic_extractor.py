@@ -5,6 +5,9 @@ from typing import Set, List, Tuple, Dict
 from dataclasses import dataclass
 
 
+_WORD_RE = re.compile(r'\w+')
+
+
 @dataclass
 class TopicLexicon:
     """Lexicon for a philosophical topic"""
@@ -183,14 +186,32 @@ class TopicExtractor:
     
     def __init__(self):
         """Initialize topic extractor"""
-        # Compile regex patterns for efficiency
+        # Normalize tension order once instead of on every detection
+        self._normalized_tensions = [tuple(sorted(tension)) for tension in self.TENSIONS]
+        
+        # One bit per topic that can take part in a tension, so topic windows
+        # can be combined with | and tensions checked with a single &
+        tension_topics = dict.fromkeys(list(self.LEXICONS) + [t for pair in self.TENSIONS for t in pair])
+        self._topic_bits = {topic: 1 << i for i, topic in enumerate(tension_topics)}
+        self._tension_masks = [
+            (tension, self._topic_bits[tension[0]] | self._topic_bits[tension[1]])
+            for tension in self._normalized_tensions
+        ]
+        
+        # Single-word keywords are matched against one tokenization of the text;
+        # only hyphenated keywords and phrases still need a regex scan
+        self._keyword_sets = {}
         self._keyword_patterns = {}
         self._phrase_patterns = {}
         
         for topic, lexicon in self.LEXICONS.items():
-            # Create word boundary patterns for keywords
-            keyword_pattern = r'\b(?:' + '|'.join(re.escape(kw) for kw in lexicon.keywords) + r')\b'
-            self._keyword_patterns[topic] = re.compile(keyword_pattern, re.IGNORECASE)
+            self._keyword_sets[topic] = frozenset(kw for kw in lexicon.keywords if _WORD_RE.fullmatch(kw))
+            
+            # Create word boundary patterns for compound keywords
+            compound_keywords = [kw for kw in lexicon.keywords if not _WORD_RE.fullmatch(kw)]
+            if compound_keywords:
+                keyword_pattern = r'\b(?:' + '|'.join(re.escape(kw) for kw in compound_keywords) + r')\b'
+                self._keyword_patterns[topic] = re.compile(keyword_pattern, re.IGNORECASE)
             
             # Create phrase patterns
             if lexicon.phrases:
@@ -200,38 +221,45 @@ class TopicExtractor:
     def extract_topics(self, text: str) -> Set[str]:
         """Extract topics from text using keyword matching"""
         text_lower = text.lower()
+        words = set(_WORD_RE.findall(text_lower))
         found_topics = set()
         
+        for topic, keywords in self._keyword_sets.items():
+            if not keywords.isdisjoint(words):
+                found_topics.add(topic)
+        
         for topic, pattern in self._keyword_patterns.items():
-            if pattern.search(text_lower):
+            if topic not in found_topics and pattern.search(text_lower):
                 found_topics.add(topic)
         
         # Also check phrase patterns
         for topic, pattern in self._phrase_patterns.items():
-            if pattern.search(text_lower):
+            if topic not in found_topics and pattern.search(text_lower):
                 found_topics.add(topic)
         
         return found_topics
     
+    def topic_mask(self, topics: Set[str]) -> int:
+        """Encode a topic set as a bitmask (topics outside any tension are ignored)"""
+        mask = 0
+        for topic in topics:
+            mask |= self._topic_bits.get(topic, 0)
+        return mask
+    
+    def tensions_from_mask(self, mask: int) -> Set[Tuple[str, str]]:
+        """Get the tensions whose topics are both present in a topic bitmask"""
+        return {tension for tension, bits in self._tension_masks if mask & bits == bits}
+    
     def detect_tensions(self, text: str, recent_topics: List[Set[str]] = None, window: int = 2) -> Set[Tuple[str, str]]:
         """Detect active tensions in current text considering recent context"""
-        current_topics = self.extract_topics(text)
+        mask = self.topic_mask(self.extract_topics(text))
         
         # Combine current topics with recent topics
-        all_topics = current_topics.copy()
         if recent_topics:
             for recent in recent_topics[-window:]:
-                all_topics.update(recent)
-        
-        # Find active tensions
-        active_tensions = set()
-        for tension_a, tension_b in self.TENSIONS:
-            if tension_a in all_topics and tension_b in all_topics:
-                # Normalize order for consistent representation
-                normalized = tuple(sorted([tension_a, tension_b]))
-                active_tensions.add(normalized)
+                mask |= self.topic_mask(recent)
         
-        return active_tensions
+        return self.tensions_from_mask(mask)
     
     def get_tension_summary(self, text: str, recent_topics: List[Set[str]] = None) -> Dict[str, any]:
         """Get comprehensive tension analysis for text"""
@@ -2,99 +2,180 @@
 """Comprehensive test suite for Intellectual Gravitas quote enrichment system"""
 
 import asyncio
+import json
+import pickle
 import sys
 import logging
+import threading
+import traceback
+from collections import Counter, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
+from testing_support import buffered_print as _print, run_buffered, run
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Banner separators
+_SEP = "=" * 60
+_BIG_SEP = "=" * 80
+
+
+_REQUIRED_FIELDS = ['id', 'quote', 'author', 'source', 'era', 'tradition', 'topics', 'polarity', 'tone', 'word_count']
+
+
+def _load_corpus_cached(corpus_path: Path) -> Tuple[List[Dict], Dict[str, List[str]]]:
+    """
+    Load the JSONL corpus, reusing a pickled copy while the file is unchanged
+    
+    Returns:
+        (quotes, schema errors as quote id -> missing required fields);
+        validation only runs when the corpus is re-parsed
+    """
+    stat = corpus_path.stat()
+    key = f"{stat.st_mtime_ns}-{stat.st_size}"
+    cache_path = corpus_path.with_suffix('.jsonl.pkl')
+    
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, quotes, schema_errors = pickle.load(f)
+            if cached_key == key:
+                return quotes, schema_errors
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable corpus cache {cache_path}: {e}")
+    
+    loads = orjson.loads if orjson else json.loads
+    data = corpus_path.read_bytes()
+    quotes = [loads(line) for line in data.splitlines() if line.strip()]
+    
+    schema_errors = {}
+    for i, quote in enumerate(quotes):
+        missing = [field for field in _REQUIRED_FIELDS if field not in quote]
+        if missing:
+            schema_errors[quote.get('id', f"line {i + 1}")] = missing
+    
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump((key, quotes, schema_errors), f, protocol=5)
+    except OSError as e:
+        logger.debug(f"Could not write corpus cache {cache_path}: {e}")
+    
+    return quotes, schema_errors
+
+
+_CORPUS_PATH = Path("data/philosophical_quotes.jsonl")
+
+
+# The retriever warms up in a worker thread, so guard the shared corpus load
+_corpus_lock = threading.Lock()
+_retriever_warmup: Optional[asyncio.Task] = None
+
+
+@lru_cache(maxsize=1)
+def _parse_corpus() -> Tuple[List[Dict], Dict[str, List[str]]]:
+    return _load_corpus_cached(_CORPUS_PATH)
+
+
+def _get_corpus() -> List[Dict]:
+    """Parsed corpus shared by the corpus test and the retriever"""
+    with _corpus_lock:
+        return _parse_corpus()[0]
+
+
+def _get_schema_errors() -> Dict[str, List[str]]:
+    """Quotes missing required fields, as found when the corpus was last parsed"""
+    with _corpus_lock:
+        return _parse_corpus()[1]
+
+
+@lru_cache(maxsize=1)
+def _get_retriever():
+    """Shared QuoteRetriever so the corpus and embedding model load once per run"""
+    from src.retrieval.quote_retriever import QuoteRetriever
+    
+    return QuoteRetriever(quotes=_get_corpus())
+
+
+def _warm_retriever() -> asyncio.Task:
+    """Start building the shared retriever in a thread (once per event loop)"""
+    global _retriever_warmup
+    if _retriever_warmup is None or _retriever_warmup.get_loop() is not asyncio.get_running_loop():
+        _retriever_warmup = asyncio.create_task(asyncio.to_thread(_get_retriever))
+    return _retriever_warmup
+
 
 async def test_quote_corpus():
     """Test quote corpus loading and structure"""
-    print("\n" + "="*60)
-    print("TEST 1: Quote Corpus")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 1: Quote Corpus")
+    _print(_SEP + "\n")
+    
+    # Load the retriever's model in the background while the corpus is checked
+    _warm_retriever()
     
     try:
-        import json
-        from pathlib import Path
-        
-        corpus_path = Path("data/philosophical_quotes.jsonl")
-        
         # Test corpus file exists
-        assert corpus_path.exists(), f"Quote corpus not found at {corpus_path}"
+        assert _CORPUS_PATH.exists(), f"Quote corpus not found at {_CORPUS_PATH}"
         
         # Load and validate quotes
-        quotes = []
-        with open(corpus_path, 'r') as f:
-            for line in f:
-                if line.strip():
-                    quote = json.loads(line.strip())
-                    quotes.append(quote)
-        
-        print(f"📚 Loaded {len(quotes)} quotes from corpus")
-        assert len(quotes) > 0, "Corpus should contain quotes"
+        quotes = _get_corpus()
         
-        # Validate quote schema
-        required_fields = ['id', 'quote', 'author', 'source', 'era', 'tradition', 'topics', 'polarity', 'tone', 'word_count']
-        sample_quote = quotes[0]
+        _print(f"📚 Loaded {len(quotes)} quotes from corpus")
+        assert len(quotes) > 0, "Corpus should contain quotes"
         
-        for field in required_fields:
-            assert field in sample_quote, f"Missing required field: {field}"
+        # Validate quote schema (checked for every quote whenever the corpus changes)
+        schema_errors = _get_schema_errors()
+        assert not schema_errors, f"Quotes missing required fields: {dict(list(schema_errors.items())[:5])}"
         
-        print(f"✅ Quote schema validation passed")
+        _print(f"✅ Quote schema validation passed")
         
         # Check distribution
-        eras = {}
-        traditions = {}
-        authors = set()
-        
-        for quote in quotes:
-            era = quote['era']
-            tradition = quote['tradition']
-            eras[era] = eras.get(era, 0) + 1
-            traditions[tradition] = traditions.get(tradition, 0) + 1
-            authors.add(quote['author'])
-        
-        print(f"📊 Distribution:")
-        print(f"   Eras: {eras}")
-        print(f"   Traditions: {traditions}")
-        print(f"   Unique authors: {len(authors)}")
+        eras = Counter(quote['era'] for quote in quotes)
+        traditions = Counter(quote['tradition'] for quote in quotes)
+        authors = {quote['author'] for quote in quotes}
+        
+        _print(f"📊 Distribution:")
+        _print(f"   Eras: {dict(eras)}")
+        _print(f"   Traditions: {dict(traditions)}")
+        _print(f"   Unique authors: {len(authors)}")
         
         # Sample quotes
-        print(f"\n📝 Sample quotes:")
+        _print(f"\n📝 Sample quotes:")
         for i, quote in enumerate(quotes[:3]):
-            print(f"   {i+1}. \"{quote['quote']}\" — {quote['author']}")
-            print(f"      Topics: {', '.join(quote['topics'][:3])}")
+            _print(f"   {i+1}. \"{quote['quote']}\" — {quote['author']}")
+            _print(f"      Topics: {', '.join(quote['topics'][:3])}")
         
-        print("✅ Quote corpus tests passed")
+        _print("✅ Quote corpus tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Quote corpus tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Quote corpus tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_quote_retrieval():
     """Test quote retrieval system"""
-    print("\n" + "="*60)
-    print("TEST 2: Quote Retrieval")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 2: Quote Retrieval")
+    _print(_SEP + "\n")
     
     try:
-        from src.retrieval.quote_retriever import QuoteRetriever
+        retriever = await _warm_retriever()
+        retriever.reset_session()
         
-        retriever = QuoteRetriever()
-        
-        print(f"📚 Initialized retriever with {len(retriever.quotes)} quotes")
+        _print(f"📚 Initialized retriever with {len(retriever.quotes)} quotes")
         assert len(retriever.quotes) > 0, "Should load quotes from corpus"
         
         # Test basic retrieval
@@ -104,12 +185,12 @@ async def test_quote_retrieval():
             top_k=3
         )
         
-        print(f"\n🔍 Retrieved {len(quotes)} quotes for 'truth, knowledge, certainty':")
+        _print(f"\n🔍 Retrieved {len(quotes)} quotes for 'truth, knowledge, certainty':")
         for i, quote in enumerate(quotes, 1):
-            print(f"   {i}. {quote['author']} ({quote['era']}, {quote['tradition']})")
-            print(f"      \"{quote['quote']}\"")
-            print(f"      Relevance: {quote.get('relevance_score', 0):.3f}")
-            print(f"      Topics: {', '.join(quote['topics'][:3])}")
+            _print(f"   {i}. {quote['author']} ({quote['era']}, {quote['tradition']})")
+            _print(f"      \"{quote['quote']}\"")
+            _print(f"      Relevance: {quote.get('relevance_score', 0):.3f}")
+            _print(f"      Topics: {', '.join(quote['topics'][:3])}")
         
         assert len(quotes) > 0, "Should retrieve at least one quote"
         
@@ -119,7 +200,7 @@ async def test_quote_retrieval():
             top_k=5
         )
         
-        print(f"\n🧠 Philosophy/wisdom search returned {len(philosophy_quotes)} quotes")
+        _print(f"\n🧠 Philosophy/wisdom search returned {len(philosophy_quotes)} quotes")
         
         # Test diversity (multiple retrievals)
         authors_used = set()
@@ -131,31 +212,30 @@ async def test_quote_retrieval():
             for quote in diverse_quotes:
                 authors_used.add(quote['author'])
         
-        print(f"\n🎲 Diversity test: {len(authors_used)} unique authors across 3 retrievals")
+        _print(f"\n🎲 Diversity test: {len(authors_used)} unique authors across 3 retrievals")
         
         # Get statistics
         stats = retriever.get_statistics()
-        print(f"\n📊 Retrieval Statistics:")
-        print(f"   Total quotes: {stats['total_quotes']}")
-        print(f"   Quotes used: {stats['quotes_used']}")
-        print(f"   Unique authors: {stats['unique_authors']}")
-        print(f"   Semantic search: {stats['semantic_search_enabled']}")
+        _print(f"\n📊 Retrieval Statistics:")
+        _print(f"   Total quotes: {stats['total_quotes']}")
+        _print(f"   Quotes used: {stats['quotes_used']}")
+        _print(f"   Unique authors: {stats['unique_authors']}")
+        _print(f"   Semantic search: {stats['semantic_search_enabled']}")
         
-        print("✅ Quote retrieval tests passed")
+        _print("✅ Quote retrieval tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Quote retrieval tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Quote retrieval tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_quote_enrichment_agent():
     """Test quote enrichment agent"""
-    print("\n" + "="*60)
-    print("TEST 3: Quote Enrichment Agent")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 3: Quote Enrichment Agent")
+    _print(_SEP + "\n")
     
     try:
         from src.agents.quote_enrichment_agent import QuoteEnrichmentAgent
@@ -164,14 +244,14 @@ async def test_quote_enrichment_agent():
         # Create test agent
         enrichment_agent = QuoteEnrichmentAgent(quote_interval=2)
         
-        print(f"📚 Initialized enrichment agent (interval={enrichment_agent.quote_interval})")
+        _print(f"📚 Initialized enrichment agent (interval={enrichment_agent.quote_interval})")
         
         # Test should_enrich logic
         assert not enrichment_agent.should_enrich(0), "Should not enrich on turn 0"
         assert not enrichment_agent.should_enrich(1), "Should not enrich on turn 1 (interval=2)"
         assert enrichment_agent.should_enrich(2), "Should enrich on turn 2"
         
-        print("✅ Enrichment timing logic works")
+        _print("✅ Enrichment timing logic works")
         
         # Create test speaker
         speaker = ParticipantState(
@@ -182,7 +262,7 @@ async def test_quote_enrichment_agent():
             expertise_area="philosophy"
         )
         
-        print(f"👤 Created test speaker: {speaker.name} ({speaker.personality.value})")
+        _print(f"👤 Created test speaker: {speaker.name} ({speaker.personality.value})")
         
         # Test quote enrichment
         original_response = "Consciousness seems to require both unity and diversity of experience."
@@ -195,39 +275,39 @@ async def test_quote_enrichment_agent():
             discussion_context="We're exploring how consciousness emerges from complexity."
         )
         
-        print(f"\n📝 Original response:")
-        print(f"   {original_response}")
-        print(f"\n✨ Enriched response:")
-        print(f"   {enriched_response[:200]}...")
+        _print(f"\n📝 Original response:")
+        _print(f"   {original_response}")
+        _print(f"\n✨ Enriched response:")
+        _print(f"   {enriched_response[:200]}...")
         
         # Validate enrichment
+        # Placement templates always lead with the original response
         assert len(enriched_response) > len(original_response), "Enriched should be longer"
-        assert original_response in enriched_response, "Should contain original response"
+        assert enriched_response.startswith(original_response), "Should contain original response"
         assert "consciousness" in enriched_response.lower(), "Should preserve topic"
         
         # Test statistics
         stats = enrichment_agent.get_statistics()
-        print(f"\n📊 Enrichment Statistics:")
-        print(f"   Quotes placed: {stats['quotes_placed']}")
-        print(f"   Semantic search enabled: {stats['semantic_search_enabled']}")
+        _print(f"\n📊 Enrichment Statistics:")
+        _print(f"   Quotes placed: {stats['quotes_placed']}")
+        _print(f"   Semantic search enabled: {stats['semantic_search_enabled']}")
         
         assert stats['quotes_placed'] == 1, "Should have placed one quote"
         
-        print("✅ Quote enrichment agent tests passed")
+        _print("✅ Quote enrichment agent tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Quote enrichment agent tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Quote enrichment agent tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_voice_adaptation():
     """Test voice adaptation functionality"""
-    print("\n" + "="*60)
-    print("TEST 4: Voice Adaptation")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 4: Voice Adaptation")
+    _print(_SEP + "\n")
     
     try:
         from src.agents.quote_enrichment_agent import QuoteEnrichmentAgent
@@ -250,18 +330,28 @@ async def test_voice_adaptation():
             'topics': ['self-knowledge', 'philosophy']
         }
         
-        print(f"🎭 Testing voice adaptation for quote: \"{test_quote['quote']}\"")
+        _print(f"🎭 Testing voice adaptation for quote: \"{test_quote['quote']}\"")
         
-        for speaker in speakers:
-            try:
-                adapted = await enrichment_agent._adapt_quote_to_voice(
+        # Adaptations are independent LLM calls, so issue them together
+        results = await asyncio.gather(
+            *(
+                enrichment_agent._adapt_quote_to_voice(
                     quote=test_quote,
                     speaker=speaker,
                     context="We've been discussing self-awareness and consciousness."
                 )
+                for speaker in speakers
+            ),
+            return_exceptions=True
+        )
+        
+        for speaker, adapted in zip(speakers, results):
+            try:
+                if isinstance(adapted, Exception):
+                    raise adapted
                 
-                print(f"\n👤 {speaker.name} ({speaker.personality.value}):")
-                print(f"   \"{adapted}\"")
+                _print(f"\n👤 {speaker.name} ({speaker.personality.value}):")
+                _print(f"   \"{adapted}\"")
                 
                 # Basic validation
                 assert len(adapted) > 5, "Adapted quote should have substance"
@@ -269,24 +359,23 @@ async def test_voice_adaptation():
                 
             except Exception as e:
                 # Voice adaptation might fail due to LLM availability, but test basic functionality
-                print(f"   ⚠️ Voice adaptation failed for {speaker.name}: {e}")
-                print(f"   (This is expected if LLM is not available)")
+                _print(f"   ⚠️ Voice adaptation failed for {speaker.name}: {e}")
+                _print(f"   (This is expected if LLM is not available)")
         
-        print("✅ Voice adaptation tests passed")
+        _print("✅ Voice adaptation tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Voice adaptation tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Voice adaptation tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_orchestrator_integration():
     """Test integration with main orchestrator"""
-    print("\n" + "="*60)
-    print("TEST 5: Orchestrator Integration")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 5: Orchestrator Integration")
+    _print(_SEP + "\n")
     
     try:
         from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
@@ -322,33 +411,32 @@ async def test_orchestrator_integration():
             enable_quote_voice_adaptation=True
         )
         
-        print(f"🎭 Orchestrator created successfully")
-        print(f"📚 Quote enrichment enabled: {orchestrator.enable_quote_enrichment}")
+        _print(f"🎭 Orchestrator created successfully")
+        _print(f"📚 Quote enrichment enabled: {orchestrator.enable_quote_enrichment}")
         assert orchestrator.enable_quote_enrichment
         assert orchestrator.quote_agent is not None
         
         # Test quote agent configuration
         quote_agent = orchestrator.quote_agent
-        print(f"📖 Quote agent interval: {quote_agent.quote_interval}")
-        print(f"🎭 Voice adaptation: {quote_agent.enable_voice_adaptation}")
+        _print(f"📖 Quote agent interval: {quote_agent.quote_interval}")
+        _print(f"🎭 Voice adaptation: {quote_agent.enable_voice_adaptation}")
         assert quote_agent.quote_interval == 4
         assert quote_agent.enable_voice_adaptation == True
         
-        print("✅ Orchestrator integration tests passed")
+        _print("✅ Orchestrator integration tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Orchestrator integration tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Orchestrator integration tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_configuration_loading():
     """Test configuration loading from talks.yml"""
-    print("\n" + "="*60)
-    print("TEST 6: Configuration Loading")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 6: Configuration Loading")
+    _print(_SEP + "\n")
     
     try:
         from src.config import TalksConfig
@@ -360,10 +448,10 @@ async def test_configuration_loading():
         quote_interval = config.get('quotes.interval', 8)
         voice_adaptation = config.get('quotes.voice_adaptation', True)
         
-        print(f"⚙️  Quote config loaded:")
-        print(f"   Enabled: {quotes_enabled}")
-        print(f"   Interval: {quote_interval}")
-        print(f"   Voice adaptation: {voice_adaptation}")
+        _print(f"⚙️  Quote config loaded:")
+        _print(f"   Enabled: {quotes_enabled}")
+        _print(f"   Interval: {quote_interval}")
+        _print(f"   Voice adaptation: {voice_adaptation}")
         
         # Should have quote configuration in talks.yml now
         assert isinstance(quotes_enabled, bool)
@@ -375,10 +463,10 @@ async def test_configuration_loading():
         relevance_threshold = config.get('quotes.retrieval.relevance_threshold', 0.4)
         diversity_weight = config.get('quotes.retrieval.diversity_weight', 0.3)
         
-        print(f"🔍 Retrieval settings:")
-        print(f"   Top K: {top_k}")
-        print(f"   Relevance threshold: {relevance_threshold}")
-        print(f"   Diversity weight: {diversity_weight}")
+        _print(f"🔍 Retrieval settings:")
+        _print(f"   Top K: {top_k}")
+        _print(f"   Relevance threshold: {relevance_threshold}")
+        _print(f"   Diversity weight: {diversity_weight}")
         
         assert isinstance(top_k, int)
         assert isinstance(relevance_threshold, float)
@@ -388,38 +476,36 @@ async def test_configuration_loading():
         era_balance = config.get('quotes.balance.era', {})
         tradition_balance = config.get('quotes.balance.tradition', {})
         
-        print(f"⚖️  Balance targets:")
-        print(f"   Era balance: {era_balance}")
-        print(f"   Tradition balance: {tradition_balance}")
+        _print(f"⚖️  Balance targets:")
+        _print(f"   Era balance: {era_balance}")
+        _print(f"   Tradition balance: {tradition_balance}")
         
         if era_balance:
             assert isinstance(era_balance, dict)
             assert 'ancient' in era_balance or 'modern' in era_balance
         
-        print("✅ Configuration loading tests passed")
+        _print("✅ Configuration loading tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Configuration loading tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Configuration loading tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_diversity_enforcement():
     """Test author diversity enforcement"""
-    print("\n" + "="*60)
-    print("TEST 7: Diversity Enforcement")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 7: Diversity Enforcement")
+    _print(_SEP + "\n")
     
     try:
-        from src.retrieval.quote_retriever import QuoteRetriever
-        
-        retriever = QuoteRetriever()
+        retriever = await _warm_retriever()
+        retriever.reset_session()
         
         # Retrieve multiple times to test diversity
         all_authors = []
-        recent_authors = []
+        recent_authors = deque(maxlen=6)  # Only the recent 6 authors count for diversity
         
         for i in range(6):
             quotes = retriever.retrieve(
@@ -432,50 +518,47 @@ async def test_diversity_enforcement():
                 all_authors.extend(turn_authors)
                 recent_authors.extend(turn_authors)
                 
-                print(f"\nRetrieval {i+1}:")
+                _print(f"\nRetrieval {i+1}:")
                 for q in quotes:
-                    print(f"   - {q['author']}: \"{q['quote'][:40]}...\"")
-                
-                # Keep only recent 6 authors for diversity check
-                if len(recent_authors) > 6:
-                    recent_authors = recent_authors[-6:]
+                    _print(f"   - {q['author']}: \"{q['quote'][:40]}...\"")
         
         # Check diversity metrics
-        unique_all = len(set(all_authors))
+        author_counts = Counter(all_authors)
+        unique_all = len(author_counts)
         unique_recent = len(set(recent_authors))
         
-        print(f"\n📊 Diversity Analysis:")
-        print(f"   Total quotes retrieved: {len(all_authors)}")
-        print(f"   Unique authors (all): {unique_all}")
-        print(f"   Unique authors (recent 6): {unique_recent}/{len(recent_authors)}")
+        _print(f"\n📊 Diversity Analysis:")
+        _print(f"   Total quotes retrieved: {len(all_authors)}")
+        _print(f"   Unique authors (all): {unique_all}")
+        _print(f"   Most quoted: {author_counts.most_common(3)}")
+        _print(f"   Unique authors (recent 6): {unique_recent}/{len(recent_authors)}")
         
         # Get final statistics
         stats = retriever.get_statistics()
-        print(f"   Authors used: {len(stats['author_usage'])}")
-        print(f"   Recent authors: {stats['recent_authors']}")
+        _print(f"   Authors used: {len(stats['author_usage'])}")
+        _print(f"   Recent authors: {stats['recent_authors']}")
         
         # Verify diversity
         diversity_ratio = unique_recent / len(recent_authors) if recent_authors else 0
-        print(f"   Diversity ratio: {diversity_ratio:.2f}")
+        _print(f"   Diversity ratio: {diversity_ratio:.2f}")
         
         # Should have reasonable diversity (not perfect due to small test corpus)
         assert diversity_ratio >= 0.3, f"Diversity ratio too low: {diversity_ratio}"
         
-        print("✅ Diversity enforcement tests passed")
+        _print("✅ Diversity enforcement tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ Diversity enforcement tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ Diversity enforcement tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def test_end_to_end_flow():
     """Test complete end-to-end quote enrichment flow"""
-    print("\n" + "="*60)
-    print("TEST 8: End-to-End Flow")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 8: End-to-End Flow")
+    _print(_SEP + "\n")
     
     try:
         from src.agents.quote_enrichment_agent import QuoteEnrichmentAgent
@@ -489,7 +572,7 @@ async def test_end_to_end_flow():
             ParticipantState("bob", "Bob", Gender.MALE, PersonalityArchetype.CREATIVE, "philosophy")
         ]
         
-        print("🎬 Starting end-to-end quote enrichment scenario...")
+        _print("🎬 Starting end-to-end quote enrichment scenario...")
         
         # Simulate multiple turns
         responses = [
@@ -502,55 +585,65 @@ async def test_end_to_end_flow():
         ]
         
         enriched_count = 0
+        discussion_topics = ["consciousness", "awareness", "mind"]
+        current_tension = ("mind", "matter")
+        
+        # Topics are fixed for the whole scenario, so embed them once
+        topic_embedding = enrichment_agent.retriever.embed_topics(discussion_topics, current_tension)
+        
+        speakers_by_name = {s.name: s for s in speakers}
         
-        for i, (speaker_name, response) in enumerate(responses):
-            speaker = next(s for s in speakers if s.name == speaker_name)
+        # Placement schedule depends only on the turn number, so decide it up front
+        enrich_turns = [enrichment_agent.should_enrich(i) for i in range(len(responses))]
+        
+        for i, ((speaker_name, response), enrich) in enumerate(zip(responses, enrich_turns)):
+            speaker = speakers_by_name[speaker_name]
             
-            print(f"\nTurn {i}: {speaker_name}")
-            print(f"Original: {response}")
+            _print(f"\nTurn {i}: {speaker_name}")
+            _print(f"Original: {response}")
             
-            if enrichment_agent.should_enrich(i):
+            if enrich:
                 try:
                     enriched = await enrichment_agent.enrich_response(
                         response=response,
                         speaker=speaker,
-                        discussion_topics=["consciousness", "awareness", "mind"],
-                        current_tension=("mind", "matter"),
-                        discussion_context="Philosophical discussion about consciousness"
+                        discussion_topics=discussion_topics,
+                        current_tension=current_tension,
+                        discussion_context="Philosophical discussion about consciousness",
+                        topic_embedding=topic_embedding
                     )
                     
-                    print(f"Enriched: {enriched[:150]}...")
+                    _print(f"Enriched: {enriched[:150]}...")
                     enriched_count += 1
                     
                     # Validate enrichment
                     assert len(enriched) > len(response), "Should be enriched"
-                    assert response in enriched, "Should contain original"
+                    assert enriched.startswith(response), "Should contain original"
                     
                 except Exception as e:
-                    print(f"   ⚠️ Enrichment failed: {e}")
+                    _print(f"   ⚠️ Enrichment failed: {e}")
             else:
-                print(f"No enrichment (interval not met)")
+                _print(f"No enrichment (interval not met)")
         
         # Check final statistics
         final_stats = enrichment_agent.get_statistics()
-        print(f"\n📊 Final Statistics:")
-        print(f"   Quotes placed: {final_stats['quotes_placed']}")
-        print(f"   Expected: {enriched_count}")
+        _print(f"\n📊 Final Statistics:")
+        _print(f"   Quotes placed: {final_stats['quotes_placed']}")
+        _print(f"   Expected: {enriched_count}")
         
-        print("✅ End-to-end flow tests passed")
+        _print("✅ End-to-end flow tests passed")
         return True
         
     except Exception as e:
-        print(f"❌ End-to-end flow tests failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print(f"❌ End-to-end flow tests failed: {e}")
+        _print(traceback.format_exc(), end="")
         return False
 
 
 async def main():
     """Run all quote enrichment tests"""
     print("🚀 Starting Intellectual Gravitas Quote Enrichment Test Suite")
-    print("=" * 80)
+    print(_BIG_SEP)
     
     tests = [
         test_quote_corpus,
@@ -566,18 +659,20 @@ async def main():
     passed = 0
     failed = 0
     
-    for test in tests:
-        try:
-            result = await test()
-            if result:
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
+    # Tests share no mutable state (retriever users reset it first and never
+    # await mid-retrieval), so run them concurrently to overlap LLM calls
+    results = await asyncio.gather(*(run_buffered(test) for test in tests), return_exceptions=True)
+    
+    for test, result in zip(tests, results):
+        if isinstance(result, Exception):
+            print(f"❌ Test {test.__name__} crashed: {result}")
+            failed += 1
+        elif result:
+            passed += 1
+        else:
             failed += 1
     
-    print("\n" + "=" * 80)
+    print("\n" + _BIG_SEP)
     print(f"🎉 TEST RESULTS: {passed} passed, {failed} failed")
     
     if failed == 0:
@@ -595,11 +690,11 @@ async def main():
     else:
         print(f"⚠️ {failed} tests failed - check implementation")
     
-    print("=" * 80)
+    print(_BIG_SEP)
     
     return failed == 0
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    success = run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -11,19 +11,78 @@ This test verifies:
 """
 
 import asyncio
+import re
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
+
+import pytest
+from langchain_core.globals import set_llm_cache
+
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
+from src.utils.llm_cache import enable_test_llm_cache
+from testing_support import buffered_print as _print, run_buffered, run_discussion, run
+
+# Each test builds its own orchestrators, so they also run under pytest
+pytestmark = pytest.mark.asyncio
+
+# Banner separators
+_SEP = "=" * 60
+
+
+# Citation language that styled output should NOT contain
+_CITATION_RE = re.compile(r'according to|studies show|research indicates|sources suggest', re.IGNORECASE)
+
+# First-person voice that styled output should contain
+_FIRST_PERSON_RE = re.compile(r'i believe|i argue|in my view|i think', re.IGNORECASE)
+
+# The speed of light, stated as a value or by name
+_SPEED_OF_LIGHT_RE = re.compile(r'299,792,458|299792458|3 × 10⁸|186,282|speed of light', re.IGNORECASE)
+
+# Facts phrased in a natural speaking voice
+_NATURAL_FACT_RE = re.compile(r'i know|the speed|as we know|i can tell', re.IGNORECASE)
+
+# Personality-appropriate language, one alternation per personality. Each
+# alternation sits in a zero-width lookahead so a single pass reports every
+# occurrence, and markers that overlap in the text can't hide one another
+_STYLE_MARKERS = {
+    "skeptical": ("but consider", "i question", "skeptical", "challenge", "counterexample"),
+    "creative": ("imagine", "like", "as if", "metaphor", "picture"),
+    "cautious": ("perhaps", "might", "possibly", "it seems", "could be")
+}
+_STYLE_MARKER_RES = {
+    personality: re.compile('(?=(' + '|'.join(re.escape(m) for m in markers) + '))', re.IGNORECASE)
+    for personality, markers in _STYLE_MARKERS.items()
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _llm_cache():
+    enable_test_llm_cache()
+    yield
+    set_llm_cache(None)
+
+
+@lru_cache(maxsize=1)
+def _shared_deps():
+    """Load the sentence transformer once and share it across every orchestrator"""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return {}
+    return {"embedding_model": SentenceTransformer('all-MiniLM-L6-v2')}
 
 
 async def test_rag_style_basic():
     """Test basic style transfer with web search"""
     
-    print("\n" + "="*60)
-    print("TEST 1: Basic RAG Style Transfer")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 1: Basic RAG Style Transfer")
+    _print(_SEP + "\n")
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     # Use topic that requires web search
     participants = [
@@ -47,49 +106,51 @@ async def test_rag_style_basic():
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=True
+        use_rag_styling=True,
+        shared_deps=_shared_deps()
     )
     
-    print("Configuration:")
-    print("  - Topic requires current information (web search)")
-    print("  - RAG styling: ENABLED")
-    print("  - Expected: Creative metaphors from Einstein, precise analysis from Curie")
-    print()
+    _print("Configuration:")
+    _print("  - Topic requires current information (web search)")
+    _print("  - RAG styling: ENABLED")
+    _print("  - Expected: Creative metaphors from Einstein, precise analysis from Curie")
+    _print()
     
-    exchanges = await orchestrator.run_discussion(max_iterations=8)
+    exchanges = await run_discussion(orchestrator, 8)
     
-    print(f"\n{'='*60}")
-    print(f"✅ Test 1 Complete")
-    print(f"{'='*60}")
-    print(f"  - Exchanges: {len(exchanges)}")
-    print(f"  - Log: {orchestrator._log_filepath}")
+    _print("\n" + _SEP)
+    _print(f"✅ Test 1 Complete")
+    _print(_SEP)
+    _print(f"  - Exchanges: {len(exchanges)}")
+    _print(f"  - Log: {orchestrator._log_filepath}")
     
     # Analyze responses for style indicators
-    print("\nStyle Analysis:")
+    _print("\nStyle Analysis:")
     for exchange in exchanges:
-        content = exchange['content'].lower()
+        content = exchange['content']
         speaker = exchange['speaker']
         personality = exchange['personality']
         
         # Check for bad patterns (should NOT appear)
-        bad_patterns = ['according to', 'studies show', 'research indicates', 'sources suggest']
-        has_citation = any(pattern in content for pattern in bad_patterns)
+        has_citation = _CITATION_RE.search(content) is not None
         
         # Check for good patterns (should appear)
-        first_person = any(phrase in content for phrase in ['i believe', 'i argue', 'in my view', 'i think'])
+        first_person = _FIRST_PERSON_RE.search(content) is not None
         
         if has_citation:
-            print(f"  ⚠️  {speaker}: Contains citation language")
+            _print(f"  ⚠️  {speaker}: Contains citation language")
         if first_person:
-            print(f"  ✓ {speaker} ({personality}): Using first-person voice")
+            _print(f"  ✓ {speaker} ({personality}): Using first-person voice")
 
 
 async def test_personality_styles():
     """Test that different personalities produce different styles"""
     
-    print("\n" + "="*60)
-    print("TEST 2: Personality-Specific Styles")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 2: Personality-Specific Styles")
+    _print(_SEP + "\n")
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     # Test with diverse personalities
     participants = [
@@ -119,45 +180,42 @@ async def test_personality_styles():
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=True
+        use_rag_styling=True,
+        shared_deps=_shared_deps()
     )
     
-    print("Testing personalities:")
-    print("  - Skeptical: Should challenge and question")
-    print("  - Creative: Should use metaphors and analogies")
-    print("  - Cautious: Should hedge and qualify")
-    print()
-    
-    exchanges = await orchestrator.run_discussion(max_iterations=6)
+    _print("Testing personalities:")
+    _print("  - Skeptical: Should challenge and question")
+    _print("  - Creative: Should use metaphors and analogies")
+    _print("  - Cautious: Should hedge and qualify")
+    _print()
     
-    # Check for personality-appropriate language
-    style_markers = {
-        "skeptical": ["but consider", "i question", "skeptical", "challenge", "counterexample"],
-        "creative": ["imagine", "like", "as if", "metaphor", "picture"],
-        "cautious": ["perhaps", "might", "possibly", "it seems", "could be"]
-    }
+    exchanges = await run_discussion(orchestrator, 6)
     
-    print("\nPersonality Style Detection:")
+    _print("\nPersonality Style Detection:")
     for exchange in exchanges:
         speaker = exchange['speaker']
         personality = exchange['personality']
-        content = exchange['content'].lower()
         
-        markers = style_markers.get(personality, [])
-        found_markers = [m for m in markers if m in content]
+        # One regex pass per exchange, reported in marker order
+        marker_re = _STYLE_MARKER_RES.get(personality)
+        found = {m.lower() for m in marker_re.findall(exchange['content'])} if marker_re else set()
+        found_markers = [m for m in _STYLE_MARKERS.get(personality, ()) if m in found]
         
         if found_markers:
-            print(f"  ✓ {speaker} ({personality}): Found style markers: {found_markers}")
+            _print(f"  ✓ {speaker} ({personality}): Found style markers: {found_markers}")
         else:
-            print(f"  ⚠️  {speaker} ({personality}): No personality markers detected")
+            _print(f"  ⚠️  {speaker} ({personality}): No personality markers detected")
 
 
 async def test_rag_disabled():
     """Test that style transfer can be disabled"""
     
-    print("\n" + "="*60)
-    print("TEST 3: RAG Styling Disabled")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 3: RAG Styling Disabled")
+    _print(_SEP + "\n")
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     participants = [
         {
@@ -180,22 +238,25 @@ async def test_rag_disabled():
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=False  # DISABLED
+        use_rag_styling=False,  # DISABLED
+        shared_deps=_shared_deps()
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=4)
+    exchanges = await run_discussion(orchestrator, 4)
     
-    print(f"✓ Completed without style transfer")
-    print(f"  - Exchanges: {len(exchanges)}")
-    print(f"  - RAG styling was disabled as requested")
+    _print(f"✓ Completed without style transfer")
+    _print(f"  - Exchanges: {len(exchanges)}")
+    _print(f"  - RAG styling was disabled as requested")
 
 
 async def test_accuracy_preservation():
     """Test that factual accuracy is preserved during style transfer"""
     
-    print("\n" + "="*60)
-    print("TEST 4: Accuracy Preservation")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 4: Accuracy Preservation")
+    _print(_SEP + "\n")
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     participants = [
         {
@@ -213,30 +274,33 @@ async def test_accuracy_preservation():
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=True
+        use_rag_styling=True,
+        shared_deps=_shared_deps()
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=2)
+    exchanges = await run_discussion(orchestrator, 2)
     
-    print("Checking for accurate information:")
+    _print("Checking for accurate information:")
     for exchange in exchanges:
         content = exchange['content']
         
         # Check if the response contains the correct value (approximately)
-        if '299,792,458' in content or '299792458' in content or '3 × 10⁸' in content or '186,282' in content or 'speed of light' in content.lower():
-            print(f"  ✓ Speed of light information found")
+        if _SPEED_OF_LIGHT_RE.search(content):
+            _print(f"  ✓ Speed of light information found")
         
         # Check that it's in first person despite being factual
-        if any(phrase in content.lower() for phrase in ['i know', 'the speed', 'as we know', 'i can tell']):
-            print(f"  ✓ Factual information expressed naturally")
+        if _NATURAL_FACT_RE.search(content):
+            _print(f"  ✓ Factual information expressed naturally")
 
 
 async def test_comparison_with_without():
     """Compare responses with and without style transfer"""
     
-    print("\n" + "="*60)
-    print("TEST 5: With/Without Comparison")
-    print("="*60 + "\n")
+    _print("\n" + _SEP)
+    _print("TEST 5: With/Without Comparison")
+    _print(_SEP + "\n")
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     participants = [
         {
@@ -249,69 +313,82 @@ async def test_comparison_with_without():
     
     topic = "What are recent breakthroughs in brain-computer interfaces?"
     
-    # Test WITHOUT style transfer
-    print("Running WITHOUT style transfer...")
+    # WITHOUT style transfer
     orchestrator1 = MultiAgentDiscussionOrchestrator(
         topic=topic,
         target_depth=1,
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=False
+        use_rag_styling=False,
+        shared_deps=_shared_deps()
     )
-    exchanges1 = await orchestrator1.run_discussion(max_iterations=2)
     
-    # Test WITH style transfer
-    print("Running WITH style transfer...")
+    # WITH style transfer
     orchestrator2 = MultiAgentDiscussionOrchestrator(
         topic=topic,
         target_depth=1,
         participants_config=participants,
         enable_narrator=False,
         enable_synthesizer=False,
-        use_rag_styling=True
+        use_rag_styling=True,
+        shared_deps=_shared_deps()
     )
-    exchanges2 = await orchestrator2.run_discussion(max_iterations=2)
-    
-    print("\nComparison:")
-    print("  Without styling:", len(exchanges1), "exchanges")
-    print("  With styling:", len(exchanges2), "exchanges")
-    print(f"\n  Check logs to compare writing styles:")
-    print(f"    Without: {orchestrator1._log_filepath}")
-    print(f"    With: {orchestrator2._log_filepath}")
+    
+    # The two runs share no state (each orchestrator has its own session log)
+    _print("Running WITHOUT and WITH style transfer...")
+    exchanges1, exchanges2 = await asyncio.gather(
+        run_discussion(orchestrator1, 2),
+        run_discussion(orchestrator2, 2)
+    )
+    
+    _print("\nComparison:")
+    _print("  Without styling:", len(exchanges1), "exchanges")
+    _print("  With styling:", len(exchanges2), "exchanges")
+    _print(f"\n  Check logs to compare writing styles:")
+    _print(f"    Without: {orchestrator1._log_filepath}")
+    _print(f"    With: {orchestrator2._log_filepath}")
 
 
 async def run_all_tests():
     """Run all RAG style transfer tests"""
+    enable_test_llm_cache()
     
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("RAG STYLE TRANSFER TEST SUITE")
-    print("="*60)
+    print(_SEP)
+    
+    tests = [
+        test_rag_style_basic,
+        test_personality_styles,
+        test_rag_disabled,
+        test_accuracy_preservation,
+        test_comparison_with_without
+    ]
     
-    try:
-        await test_rag_style_basic()
-        await test_personality_styles()
-        await test_rag_disabled()
-        await test_accuracy_preservation()
-        await test_comparison_with_without()
-        
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED")
-        print("="*60 + "\n")
-        
-        print("Summary of Style Transfer Features:")
-        print("  ✓ Web search results detected and styled")
-        print("  ✓ Different personalities produce different styles")
-        print("  ✓ No 'According to...' citations in output")
-        print("  ✓ First-person voice maintained")
-        print("  ✓ Factual accuracy preserved")
-        print("  ✓ Can be disabled when not needed")
-        
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    # Tests build their own orchestrators and are dominated by LLM/web
+    # latency, so run them concurrently
+    results = await asyncio.gather(*(run_buffered(test) for test in tests), return_exceptions=True)
+    
+    failures = [(test, result) for test, result in zip(tests, results) if isinstance(result, Exception)]
+    if failures:
+        for test, error in failures:
+            print(f"\n❌ TEST FAILED ({test.__name__}): {error}")
+            traceback.print_exception(error)
+        return
+    
+    print("\n" + _SEP)
+    print("✅ ALL TESTS PASSED")
+    print(_SEP + "\n")
+    
+    print("Summary of Style Transfer Features:")
+    print("  ✓ Web search results detected and styled")
+    print("  ✓ Different personalities produce different styles")
+    print("  ✓ No 'According to...' citations in output")
+    print("  ✓ First-person voice maintained")
+    print("  ✓ Factual accuracy preserved")
+    print("  ✓ Can be disabled when not needed")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_all_tests())
\ No newline at end of file
+    run(run_all_tests())
\ No newline at end of file
@@ -1,47 +1,68 @@
 #!/usr/bin/env python3
 """Check if recent logs have cleanup applied"""
 
+import heapq
+import mmap
+import os
 import re
 from pathlib import Path
 
+# Pattern: <Name>\nName:
+_REDUNDANT_PREFIX_RE = re.compile(rb'<([A-Za-z-]+)>\n\1:')
+
+# Banner separators
+_SEP = "=" * 60
+_SUB_SEP = "-" * 40
+
 def check_logs():
     """Check recent logs for redundant speaker prefixes"""
     
     outputs_dir = Path("outputs")
     
-    # Get most recent conversation logs
-    logs = sorted(outputs_dir.glob("conversation_talks_*.md"), key=lambda f: f.stat().st_mtime)
+    # Get the 3 most recent conversation logs (DirEntry caches its stat result);
+    # a missing outputs/ directory just means there are no logs yet
+    entries = [
+        entry for entry in os.scandir(outputs_dir)
+        if entry.name.startswith("conversation_talks_") and entry.name.endswith(".md")
+    ] if outputs_dir.is_dir() else []
+    logs = heapq.nlargest(3, entries, key=lambda entry: entry.stat().st_mtime)
+    logs.reverse()  # Oldest first, as before
     
     print("Checking Recent Logs for Redundant Speaker Prefixes")
-    print("=" * 60)
+    print(_SEP)
     
     # Check last 3 logs
-    for log_file in logs[-3:]:
+    for log_file in logs:
         print(f"\nChecking: {log_file.name}")
         print(f"Modified: {log_file.stat().st_mtime}")
-        print("-" * 40)
+        print(_SUB_SEP)
         
-        with open(log_file, 'r') as f:
-            content = f.read()
+        # Scan the file through a memory map instead of reading it into a str;
+        # only the matched names and the example snippet are decoded
+        count = 0
+        names = set()
+        snippet = None
         
-        # Look for pattern: <Name>\nName: 
-        pattern = r'<([A-Za-z-]+)>\n\1:'
-        matches = re.findall(pattern, content)
+        if log_file.stat().st_size > 0:  # mmap cannot map an empty file
+            with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in _REDUNDANT_PREFIX_RE.finditer(mm):
+                    count += 1
+                    names.add(match.group(1).decode())
+                    
+                    if snippet is None:
+                        start = max(0, match.start() - 20)
+                        end = min(len(mm), match.end() + 100)
+                        snippet = mm[start:end].decode('utf-8', errors='replace').replace('\n', '\\n')
         
-        if matches:
-            print(f"❌ Found {len(matches)} redundant prefixes for: {', '.join(set(matches))}")
+        if count:
+            print(f"❌ Found {count} redundant prefixes for: {', '.join(names)}")
             
             # Show first example
-            first_match = re.search(pattern, content)
-            if first_match:
-                start = max(0, first_match.start() - 20)
-                end = min(len(content), first_match.end() + 100)
-                snippet = content[start:end].replace('\n', '\\n')
-                print(f"Example: ...{snippet}...")
+            print(f"Example: ...{snippet}...")
         else:
             print("✅ No redundant prefixes found")
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("\nConclusion:")
     print("If redundant prefixes are found, the cleanup might not be applied")
     print("or the LLM is generating them in a different format.")
@@ -3,28 +3,52 @@
 
 import asyncio
 import logging
-from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
+from typing import TYPE_CHECKING
+from src.utils.llm_cache import enable_test_llm_cache
+
+# The orchestrator pulls in the LLM and agent stack, so tests import it on use
+if TYPE_CHECKING:
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Banner separators
+_SEP = "=" * 60
+_SUB_SEP = "-" * 40
+
+
+async def _summarize_discussion(orchestrator: "MultiAgentDiscussionOrchestrator", max_iterations: int) -> dict:
+    """Fold a streamed discussion into the aggregates the test reports, without keeping the exchanges"""
+    stats = {'turns': 0, 'entailments': 0, 'words': 0, 'unique_entailments': set(), 'syntheses': 0}
+    
+    async for e in orchestrator.stream_discussion(max_iterations=max_iterations):
+        entailments = e.get('entailments') or ()
+        stats['turns'] += 1
+        stats['entailments'] += len(entailments)
+        stats['words'] += len(e['content'].split())
+        stats['unique_entailments'].update(entailments)
+        if e.get('move') == 'synthesis':
+            stats['syntheses'] += 1
+    
+    return stats
+
 
 async def test_redundancy_control():
     """Test that redundancy control works as designed"""
     
     print("🧪 Testing Redundancy Control Implementation")
-    print("=" * 60)
+    print(_SEP)
+    
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
     
     participants = [
         {"name": "Alice", "gender": "female", "personality": "analytical", "expertise": "logic"},
         {"name": "Bob", "gender": "male", "personality": "creative", "expertise": "ethics"}
     ]
     
-    # Test with redundancy control enabled
-    print("\n1. Testing with redundancy control ENABLED")
-    print("-" * 40)
-    
+    # With redundancy control enabled
     orchestrator = MultiAgentDiscussionOrchestrator(
         topic="The nature of truth",
         target_depth=3,
@@ -37,39 +61,52 @@ async def test_redundancy_control():
         similarity_threshold=0.85
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=24)
+    # Without redundancy control, for comparison
+    orchestrator_no_control = MultiAgentDiscussionOrchestrator(
+        topic="The nature of truth",
+        target_depth=3,
+        participants_config=participants,
+        enable_narrator=True,
+        enable_synthesizer=True,
+        synthesis_frequency=12,
+        enable_redundancy_control=False  # Disabled for comparison
+    )
+    
+    # The two discussions share no state, so run them concurrently
+    print("\nRunning discussions with and without redundancy control...")
+    stats, stats_no_control = await asyncio.gather(
+        _summarize_discussion(orchestrator, 24),
+        _summarize_discussion(orchestrator_no_control, 24)
+    )
+    
+    print("\n1. Testing with redundancy control ENABLED")
+    print(_SUB_SEP)
     
     # Verify constraints
     print(f"\n📊 Results with redundancy control:")
-    print(f"  Total turns: {len(exchanges)}")
+    print(f"  Total turns: {stats['turns']}")
     print(f"  Dyad states: {len(orchestrator.group_state.dyads)}")
     
     # Check entailments
-    entailment_counts = sum(
-        len(e.get('entailments', [])) for e in exchanges
-    )
+    entailment_counts = stats['entailments']
     print(f"  Total entailments detected: {entailment_counts}")
     
     # Check dyad violations
-    dyad_violations = 0
-    for dyad in orchestrator.group_state.dyads.values():
-        if dyad.volleys_used > dyad.max_volleys:
-            dyad_violations += 1
+    dyad_violations = sum(
+        1 for dyad in orchestrator.group_state.dyads.values()
+        if dyad.volleys_used > dyad.max_volleys
+    )
     print(f"  Dyad violations: {dyad_violations}")
     
     # Check synthesis frequency
-    synthesis_count = sum(1 for e in exchanges if e.get('move') == 'synthesis')
-    expected_syntheses = len(exchanges) // 12
+    synthesis_count = stats['syntheses']
+    expected_syntheses = stats['turns'] // 12
     print(f"  Syntheses generated: {synthesis_count} (expected: {expected_syntheses})")
     
     # Test information density
-    if exchanges:
-        total_words = sum(len(e['content'].split()) for e in exchanges)
-        unique_entailments = set()
-        for e in exchanges:
-            for ent in e.get('entailments', []):
-                unique_entailments.add(ent)
-        
+    if stats['turns']:
+        total_words = stats['words']
+        unique_entailments = stats['unique_entailments']
         density = len(unique_entailments) / total_words if total_words > 0 else 0
         print(f"  Information density: {density:.4f} (unique entailments per word)")
     
@@ -77,32 +114,20 @@ async def test_redundancy_control():
     
     # Test comparison without redundancy control
     print("\n2. Testing with redundancy control DISABLED (comparison)")
-    print("-" * 40)
-    
-    orchestrator_no_control = MultiAgentDiscussionOrchestrator(
-        topic="The nature of truth",
-        target_depth=3,
-        participants_config=participants,
-        enable_narrator=True,
-        enable_synthesizer=True,
-        synthesis_frequency=12,
-        enable_redundancy_control=False  # Disabled for comparison
-    )
-    
-    exchanges_no_control = await orchestrator_no_control.run_discussion(max_iterations=24)
+    print(_SUB_SEP)
     
     print(f"\n📊 Results without redundancy control:")
-    print(f"  Total turns: {len(exchanges_no_control)}")
+    print(f"  Total turns: {stats_no_control['turns']}")
     print(f"  Entailments tracking: {'Not available' if not hasattr(orchestrator_no_control, 'entailment_detector') else 'Available'}")
     
     # Print comparison
     print("\n📈 Comparison Summary:")
-    print(f"  Turns with control: {len(exchanges)} vs without: {len(exchanges_no_control)}")
+    print(f"  Turns with control: {stats['turns']} vs without: {stats_no_control['turns']}")
     print(f"  Entailments with control: {entailment_counts} vs without: N/A")
     
     return {
-        'with_control': len(exchanges),
-        'without_control': len(exchanges_no_control),
+        'with_control': stats['turns'],
+        'without_control': stats_no_control['turns'],
         'entailments': entailment_counts,
         'dyad_violations': dyad_violations,
         'synthesis_count': synthesis_count
@@ -112,7 +137,7 @@ async def test_redundancy_control():
 async def test_entailment_detector():
     """Test entailment detection patterns"""
     print("\n3. Testing Entailment Detector")
-    print("-" * 40)
+    print(_SUB_SEP)
     
     from src.utils.entailment_detector import EntailmentDetector
     
@@ -140,7 +165,7 @@ async def test_entailment_detector():
 async def test_redundancy_checker():
     """Test redundancy checking"""
     print("\n4. Testing Redundancy Checker")
-    print("-" * 40)
+    print(_SUB_SEP)
     
     from src.utils.redundancy_checker import RedundancyChecker
     
@@ -174,8 +199,10 @@ async def test_redundancy_checker():
 
 async def main():
     """Run all tests"""
+    enable_test_llm_cache()
+    
     print("🚀 Starting Redundancy Control Test Suite")
-    print("=" * 60)
+    print(_SEP)
     
     try:
         # Run main test
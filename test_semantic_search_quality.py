@@ -18,19 +18,39 @@ import time
 import numpy as np
 from pathlib import Path
 from collections import Counter, defaultdict
-from typing import List, Dict, Tuple, Set
+from dataclasses import dataclass
+from itertools import chain
+from typing import List, Dict, FrozenSet, Optional, Tuple, Set, Union
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent / "src"))
 
-try:
-    from retrieval.quote_retriever import QuoteRetriever
-    from utils.llm_client import LLMClient
-except ImportError as e:
-    print(f"⚠️  Import error: {e}")
-    print("Running without semantic search - using basic text matching")
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """A search query tokenized once, shared by the search and the evaluators"""
+    raw: str
+    tokens: FrozenSet[str]
+    
+    @classmethod
+    def from_text(cls, query: Union[str, 'PreparedQuery']) -> 'PreparedQuery':
+        """Tokenize a query string (an already prepared query is returned as-is)"""
+        if isinstance(query, PreparedQuery):
+            return query
+        return cls(query, frozenset(query.lower().split()))
+
+
+def _mean(values: List[float]) -> float:
+    """Average of a short list; cheaper than np.mean's array conversion for a handful of floats"""
+    return sum(values) / len(values) if values else 0.0
+
 
 class SemanticSearchQualityTester:
     """Tests semantic search quality on philosophical quotes corpus"""
@@ -113,16 +133,32 @@ class SemanticSearchQualityTester:
         # Load corpus for analysis
         self.corpus = self._load_corpus()
         self.corpus_topics = self._extract_all_topics()
+        self._build_columns()
+        
+        # (query, limit) -> results for repeated queries; a hit returns the first
+        # results as-is, without going through the retriever's author-diversity tracking
+        self._search_cache: Dict[Tuple[str, int], Tuple[Dict, ...]] = {}
+        self.search_cache_hits = 0
+        self.search_cache_misses = 0
         
-        # Initialize retriever if available
+        # Initialize retriever if available; imported here so text-matching runs
+        # don't pay for loading the encoder stack
         try:
-            self.retriever = QuoteRetriever()
-            self.has_semantic_search = True
-            print("✅ Semantic search enabled")
-        except:
-            self.retriever = None  
+            from retrieval.quote_retriever import QuoteRetriever
+        except ImportError as e:
+            print(f"⚠️  Import error: {e}")
+            print("Running without semantic search - using basic text matching")
+            self.retriever = None
             self.has_semantic_search = False
-            print("⚠️  Semantic search not available - using text matching")
+        else:
+            try:
+                self.retriever = QuoteRetriever(quotes=self.corpus)
+                self.has_semantic_search = True
+                print("✅ Semantic search enabled")
+            except Exception:
+                self.retriever = None
+                self.has_semantic_search = False
+                print("⚠️  Semantic search not available - using text matching")
     
     def _load_corpus(self) -> List[Dict]:
         """Load the enhanced philosophical quotes corpus"""
@@ -130,9 +166,9 @@ class SemanticSearchQualityTester:
         quotes = []
         
         if corpus_path.exists():
-            with open(corpus_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    quotes.append(json.loads(line))
+            # One read of the raw bytes, then a parse per JSONL line
+            loads = orjson.loads if orjson is not None else json.loads
+            quotes = [loads(line) for line in corpus_path.read_bytes().splitlines() if line.strip()]
         
         return quotes
     
@@ -143,14 +179,141 @@ class SemanticSearchQualityTester:
             all_topics.update(quote.get('topics', []))
         return all_topics
     
-    def search_quotes(self, query: str, limit: int = 10) -> List[Dict]:
-        """Search for quotes using available method"""
+    def _build_columns(self):
+        """
+        Encode the per-row fields the searches and evaluators read, in one pass over the corpus
+        
+        Rows follow self.corpus. Words and lowercased topics feed the fallback
+        search and relevance; era/tradition codes and the topic bitsets (built
+        from a CSR of topic ids) feed coverage counting.
+        """
+        self._rows: Dict[str, int] = {}  # quote id -> corpus row
+        self._quote_words: List[frozenset] = []
+        self._quote_topics: List[frozenset] = []  # lowercased
+        text_postings = defaultdict(list)
+        topic_postings = defaultdict(list)
+        
+        topic_ids = {topic: i for i, topic in enumerate(self.corpus_topics)}
+        era_codes, tradition_codes = {}, {}
+        eras, traditions, row_topic_ids, topic_counts = [], [], [], []
+        
+        for i, quote in enumerate(self.corpus):
+            quote_words = frozenset(quote['quote'].lower().split())
+            topics = quote.get('topics', [])
+            quote_topics = frozenset(topic.lower() for topic in topics)
+            
+            self._rows[quote.get('id')] = i
+            self._quote_words.append(quote_words)
+            self._quote_topics.append(quote_topics)
+            for word in quote_words:
+                text_postings[word].append(i)
+            for topic in quote_topics:
+                topic_postings[topic].append(i)
+            
+            eras.append(era_codes.setdefault(quote.get('era', 'unknown'), len(era_codes)))
+            traditions.append(tradition_codes.setdefault(quote.get('tradition', 'unknown'), len(tradition_codes)))
+            row_topic_ids.extend(topic_ids[topic] for topic in topics)
+            topic_counts.append(len(topics))
+        
+        # Posting lists as row arrays so scoring is a bincount rather than a Python loop
+        self._text_postings: Dict[str, np.ndarray] = {
+            word: np.array(rows, dtype=np.intp) for word, rows in text_postings.items()
+        }
+        self._topic_postings: Dict[str, np.ndarray] = {
+            topic: np.array(rows, dtype=np.intp) for topic, rows in topic_postings.items()
+        }
+        
+        self._era_codes = np.array(eras, dtype=np.intp)
+        self._tradition_codes = np.array(traditions, dtype=np.intp)
+        
+        # Topic ids per row in CSR form, expanded into packed per-row bitsets
+        self._topic_ids = np.array(row_topic_ids, dtype=np.intp)
+        self._topic_offsets = np.concatenate(([0], np.cumsum(topic_counts, dtype=np.intp)))
+        topic_matrix = np.zeros((len(self.corpus), len(topic_ids)), dtype=bool)
+        topic_matrix[np.repeat(np.arange(len(self.corpus)), topic_counts), self._topic_ids] = True
+        self._topic_bits = np.packbits(topic_matrix, axis=1)
+    
+    def _result_rows(self, results: List[Dict]) -> Optional[np.ndarray]:
+        """Corpus rows of the given results, or None if any of them is not from the corpus"""
+        try:
+            return np.fromiter((self._rows[quote['id']] for quote in results), dtype=np.intp, count=len(results))
+        except KeyError:
+            return None
+    
+    def _tokens(self, quote: Dict) -> Tuple[frozenset, frozenset]:
+        """Cached (words, lowercased topics) of a quote, tokenized on the spot if not in the corpus"""
+        row = self._rows.get(quote.get('id'))
+        if row is None:
+            return (frozenset(quote['quote'].lower().split()),
+                    frozenset(topic.lower() for topic in quote.get('topics', [])))
+        return self._quote_words[row], self._quote_topics[row]
+    
+    def search_quotes(self, query: Union[str, PreparedQuery], limit: int = 10) -> List[Dict]:
+        """Search for quotes using available method, reusing results for repeated queries"""
+        
+        query = PreparedQuery.from_text(query)
+        key = (query.raw, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self.search_cache_hits += 1
+            return list(cached)
+        
+        self.search_cache_misses += 1
+        results = self._search_uncached(query, limit)
+        if len(self._search_cache) >= 512:
+            # Drop the oldest entry to keep the cache bounded
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = tuple(results)
+        return results
+    
+    def search_quotes_batch(
+        self, queries: List[Union[str, PreparedQuery]], limit: int = 10
+    ) -> Tuple[List[List[Dict]], List[float]]:
+        """
+        Search several queries, encoding the uncached ones for semantic search in one batch
+        
+        Returns each query's results and its search time in seconds; the shared
+        batch encoding time is split evenly across the queries.
+        """
+        
+        queries = [PreparedQuery.from_text(query) for query in queries]
+        embed_ns = 0
+        if self.has_semantic_search:
+            # Repeated queries are encoded once and later served from the search cache
+            pending = list(dict.fromkeys(query.raw for query in queries
+                                         if (query.raw, limit) not in self._search_cache))
+            start_time = time.perf_counter_ns()
+            try:
+                self.retriever.embed_search_queries(pending)
+            except Exception as e:
+                print(f"⚠️  Batch query embedding failed: {e}")
+            embed_ns = time.perf_counter_ns() - start_time
+        
+        embed_share_ns = embed_ns / len(queries) if queries else 0
+        results, durations = [], []
+        for query in queries:
+            start_time = time.perf_counter_ns()
+            results.append(self.search_quotes(query, limit))
+            durations.append((time.perf_counter_ns() - start_time + embed_share_ns) / 1e9)
+        
+        return results, durations
+    
+    def _warm_up(self):
+        """Pay the encoder's first-call cost outside timed searches (searching would change diversity state)"""
+        if self.has_semantic_search:
+            try:
+                self.retriever.embed_search_queries(["warm up"])
+            except Exception as e:
+                print(f"⚠️  Warm-up failed: {e}")
+    
+    def _search_uncached(self, query: PreparedQuery, limit: int) -> List[Dict]:
+        """Run a search with the semantic retriever, or text matching as a fallback"""
         
         if self.has_semantic_search:
             try:
                 # Use semantic search
                 results = self.retriever.search_quotes(
-                    query=query,
+                    query=query.raw,
                     limit=limit,
                     diversity_threshold=0.7
                 )
@@ -161,46 +324,51 @@ class SemanticSearchQualityTester:
         else:
             return self._fallback_text_search(query, limit)
     
-    def _fallback_text_search(self, query: str, limit: int = 10) -> List[Dict]:
+    def _fallback_text_search(self, query: Union[str, PreparedQuery], limit: int = 10) -> List[Dict]:
         """Fallback text-based search"""
         
-        query_words = set(query.lower().split())
-        scored_quotes = []
+        query_words = PreparedQuery.from_text(query).tokens
+        empty = np.empty(0, dtype=np.intp)
         
-        for quote in self.corpus:
-            # Simple text matching score
-            quote_words = set(quote['quote'].lower().split())
-            topic_words = set(word.lower() for word in quote.get('topics', []))
-            
-            # Calculate relevance score
-            text_overlap = len(query_words.intersection(quote_words))
-            topic_overlap = len(query_words.intersection(topic_words))
-            
-            score = text_overlap + (topic_overlap * 2)  # Weight topics higher
-            
-            if score > 0:
-                scored_quotes.append((score, quote))
+        # Only rows sharing a word with the query can score; each shared quote
+        # word counts once and each shared topic twice (topics weighted higher)
+        text_rows = [self._text_postings.get(word, empty) for word in query_words]
+        topic_rows = [self._topic_postings.get(word, empty) for word in query_words]
+        scores = (
+            np.bincount(np.concatenate([empty] + text_rows), minlength=len(self.corpus)) +
+            np.bincount(np.concatenate([empty] + topic_rows), minlength=len(self.corpus)) * 2
+        )
         
-        # Sort by score and return top results
-        scored_quotes.sort(reverse=True, key=lambda x: x[0])
-        return [quote for _, quote in scored_quotes[:limit]]
+        # Highest score first, ties in corpus order
+        scored = np.flatnonzero(scores)
+        ranked = scored[np.argsort(-scores[scored], kind='stable')]
+        return [self.corpus[i] for i in ranked[:limit]]
     
-    def evaluate_search_relevance(self, query: str, results: List[Dict]) -> float:
+    def evaluate_search_relevance(self, query: Union[str, PreparedQuery], results: List[Dict]) -> float:
         """Evaluate how relevant search results are to the query"""
         
         if not results:
             return 0.0
         
-        query_words = set(query.lower().split())
+        query_words = PreparedQuery.from_text(query).tokens
         relevance_scores = []
         
+        if len(query_words) == 1:
+            # A one-word query's overlap ratios are plain membership tests
+            (word,) = query_words
+            for quote in results:
+                quote_words, quote_topics = self._tokens(quote)
+                relevance_scores.append((0.4 if word in quote_words else 0.0) +
+                                        (0.6 if word in quote_topics else 0.0))
+            return sum(relevance_scores) / len(relevance_scores)
+        
         for quote in results:
+            quote_words, quote_topics = self._tokens(quote)
+            
             # Check text relevance
-            quote_words = set(quote['quote'].lower().split())
             text_relevance = len(query_words.intersection(quote_words)) / len(query_words)
             
             # Check topic relevance
-            quote_topics = set(topic.lower() for topic in quote.get('topics', []))
             topic_relevance = len(query_words.intersection(quote_topics)) / len(query_words)
             
             # Combined relevance (weighted toward topics)
@@ -215,42 +383,51 @@ class SemanticSearchQualityTester:
         if not results:
             return 0.0
         
-        # Check era diversity
-        eras = [quote.get('era', 'unknown') for quote in results]
-        era_diversity = len(set(eras)) / min(len(results), 4)  # Max 4 eras
-        
-        # Check tradition diversity  
-        traditions = [quote.get('tradition', 'unknown') for quote in results]
-        tradition_diversity = len(set(traditions)) / min(len(results), 3)  # Max 3 traditions
-        
-        # Check author diversity
-        authors = [quote.get('author', 'unknown') for quote in results]
-        author_diversity = len(set(authors)) / len(results)
+        # Collect eras, traditions, authors and topics in one pass
+        eras, traditions, authors, topics = set(), set(), set(), set()
+        for quote in results:
+            eras.add(quote.get('era', 'unknown'))
+            traditions.add(quote.get('tradition', 'unknown'))
+            authors.add(quote.get('author', 'unknown'))
+            topics.update(quote.get('topics', ()))
         
-        # Check topic diversity
-        all_topics = [topic for quote in results for topic in quote.get('topics', [])]
-        unique_topics = len(set(all_topics))
-        topic_diversity = min(unique_topics / (len(results) * 2), 1.0)  # Expect ~2 topics per quote
+        count = len(results)
+        era_diversity = len(eras) / min(count, 4)  # Max 4 eras
+        tradition_diversity = len(traditions) / min(count, 3)  # Max 3 traditions
+        author_diversity = len(authors) / count
+        topic_diversity = min(len(topics) / (count * 2), 1.0)  # Expect ~2 topics per quote
         
         return (era_diversity + tradition_diversity + author_diversity + topic_diversity) / 4
     
     def evaluate_coverage(self, all_results: Dict[str, List[Dict]]) -> float:
         """Evaluate how well search covers different philosophical domains"""
         
-        covered_topics = set()
-        covered_eras = set()
-        covered_traditions = set()
+        rows = self._result_rows([quote for domain_results in all_results.values() for quote in domain_results])
         
-        for domain_results in all_results.values():
-            for quote in domain_results:
-                covered_topics.update(quote.get('topics', []))
-                covered_eras.add(quote.get('era', 'unknown'))
-                covered_traditions.add(quote.get('tradition', 'unknown'))
+        if rows is not None:
+            # Count distinct values straight from the corpus columns
+            covered_topic_count = int(np.unpackbits(np.bitwise_or.reduce(self._topic_bits[rows], axis=0)).sum())
+            covered_era_count = np.count_nonzero(np.bincount(self._era_codes[rows]))
+            covered_tradition_count = np.count_nonzero(np.bincount(self._tradition_codes[rows]))
+        else:
+            covered_topics = set()
+            covered_eras = set()
+            covered_traditions = set()
+            
+            for domain_results in all_results.values():
+                for quote in domain_results:
+                    covered_topics.update(quote.get('topics', []))
+                    covered_eras.add(quote.get('era', 'unknown'))
+                    covered_traditions.add(quote.get('tradition', 'unknown'))
+            
+            covered_topic_count = len(covered_topics)
+            covered_era_count = len(covered_eras)
+            covered_tradition_count = len(covered_traditions)
         
         # Calculate coverage ratios
-        topic_coverage = len(covered_topics) / len(self.corpus_topics)
-        era_coverage = len(covered_eras) / 4  # ancient, modern, contemporary, mixed
-        tradition_coverage = len(covered_traditions) / 3  # western, eastern, other
+        topic_coverage = covered_topic_count / len(self.corpus_topics)
+        era_coverage = covered_era_count / 4  # ancient, modern, contemporary, mixed
+        tradition_coverage = covered_tradition_count / 3  # western, eastern, other
         
         return (topic_coverage + era_coverage + tradition_coverage) / 3
     
@@ -270,16 +447,17 @@ class SemanticSearchQualityTester:
             return 1.0
         
         # Collect all topics from results
-        all_topics = [topic for quote in results for topic in quote.get('topics', [])]
-        topic_counts = Counter(all_topics)
+        all_topics = list(chain.from_iterable(quote.get('topics', ()) for quote in results))
         
         # Calculate coherence based on topic overlap
         total_topics = len(all_topics)
         if total_topics == 0:
             return 0.0
         
-        # Measure how much topics are shared across results
-        shared_topic_ratio = sum(count for count in topic_counts.values() if count > 1) / total_topics
+        # Measure how much topics are shared across results: every mention
+        # except those of topics that appear only once
+        single_mentions = list(Counter(all_topics).values()).count(1)
+        shared_topic_ratio = (total_topics - single_mentions) / total_topics
         
         return min(shared_topic_ratio * 2, 1.0)  # Scale up to make 50% sharing = perfect score
     
@@ -293,6 +471,17 @@ class SemanticSearchQualityTester:
         all_results = {}
         domain_scores = {}
         
+        # Search every domain's queries as one batch, in domain order, so the
+        # retriever's diversity tracking sees the same sequence of searches.
+        # Each query is tokenized once, for both the search and the relevance
+        # evaluation
+        prepared = {domain: [PreparedQuery.from_text(query) for query in queries]
+                    for domain, queries in self.test_queries.items()}
+        all_queries = [query for queries in prepared.values() for query in queries]
+        self._warm_up()
+        batch_results, batch_times = self.search_quotes_batch(all_queries, limit=8)
+        search_results = iter(zip(batch_results, batch_times))
+        
         # Test each philosophical domain
         for domain, queries in self.test_queries.items():
             print(f"\n📚 Testing {domain.upper()} domain ({len(queries)} queries)...")
@@ -305,13 +494,8 @@ class SemanticSearchQualityTester:
                 'coherence': []
             }
             
-            for i, query in enumerate(queries):
-                print(f"   Query {i+1}: {query[:50]}...")
-                
-                # Perform search
-                start_time = time.time()
-                results = self.search_quotes(query, limit=8)
-                search_time = time.time() - start_time
+            for i, (query, (results, search_time)) in enumerate(zip(prepared[domain], search_results)):
+                print(f"   Query {i+1}: {query.raw[:50]}...")
                 
                 if results:
                     # Evaluate this query's results
@@ -335,10 +519,10 @@ class SemanticSearchQualityTester:
             # Calculate domain averages
             if domain_metrics['relevance']:
                 domain_score = {
-                    'relevance': np.mean(domain_metrics['relevance']),
-                    'diversity': np.mean(domain_metrics['diversity']),
-                    'quality': np.mean(domain_metrics['quality']),
-                    'coherence': np.mean(domain_metrics['coherence']),
+                    'relevance': _mean(domain_metrics['relevance']),
+                    'diversity': _mean(domain_metrics['diversity']),
+                    'quality': _mean(domain_metrics['quality']),
+                    'coherence': _mean(domain_metrics['coherence']),
                     'result_count': len(domain_results)
                 }
                 
@@ -352,10 +536,10 @@ class SemanticSearchQualityTester:
         
         # Calculate weighted overall score
         overall_metrics = {
-            'relevance': np.mean([score['relevance'] for score in domain_scores.values()]),
-            'diversity': np.mean([score['diversity'] for score in domain_scores.values()]),
-            'quality': np.mean([score['quality'] for score in domain_scores.values()]),
-            'coherence': np.mean([score['coherence'] for score in domain_scores.values()]),
+            'relevance': _mean([score['relevance'] for score in domain_scores.values()]),
+            'diversity': _mean([score['diversity'] for score in domain_scores.values()]),
+            'quality': _mean([score['quality'] for score in domain_scores.values()]),
+            'coherence': _mean([score['coherence'] for score in domain_scores.values()]),
             'coverage': coverage_score
         }
         
@@ -391,17 +575,14 @@ class SemanticSearchQualityTester:
             "human consciousness"
         ]
         
-        search_times = []
+        # One batch; each search is still timed on its own
+        self._warm_up()
+        benchmark_results, search_times = self.search_quotes_batch(benchmark_queries, limit=10)
         
-        for query in benchmark_queries:
-            start_time = time.time()
-            results = self.search_quotes(query, limit=10)
-            search_time = time.time() - start_time
-            search_times.append(search_time)
-            
+        for query, results, search_time in zip(benchmark_queries, benchmark_results, search_times):
             print(f"   '{query}': {len(results)} results in {search_time:.3f}s")
         
-        avg_search_time = np.mean(search_times)
+        avg_search_time = _mean(search_times)
         max_search_time = max(search_times)
         
         # Performance thresholds for production
@@ -418,7 +599,9 @@ class SemanticSearchQualityTester:
             'max_search_time': max_search_time,
             'performance_grade': performance_grade,
             'searches_per_second': 1.0 / avg_search_time if avg_search_time > 0 else 0,
-            'production_ready': avg_search_time < 1.0
+            'production_ready': avg_search_time < 1.0,
+            'cache_hits': self.search_cache_hits,
+            'cache_misses': self.search_cache_misses
         }
 
 def main():
@@ -457,6 +640,7 @@ def main():
     print(f"🚀 Searches per second: {performance_results['searches_per_second']:.1f}")
     print(f"📊 Performance grade: {performance_results['performance_grade']}")
     print(f"🏭 Production ready: {'✅ Yes' if performance_results['production_ready'] else '❌ No'}")
+    print(f"💾 Search cache: {performance_results['cache_hits']} hits, {performance_results['cache_misses']} misses")
     
     print(f"\n📋 DOMAIN PERFORMANCE")
     print(f"=" * 25)
@@ -11,324 +11,309 @@ This test verifies:
 """
 
 import asyncio
+import os
 import sys
+import traceback
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
 sys.path.insert(0, str(Path(__file__).parent))
 
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
 from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
-from src.states.participant_state import ParticipantState, Gender, PersonalityArchetype
+from src.states.participant_state import ParticipantState, ParticipantSpec, Gender, PersonalityArchetype
+from testing_support import buffered_print as _print, run_buffered, run_discussion, run
+
+
+# TALKS_TEST_FAST=1 (e.g. in CI) shortens discussions in tests that only check
+# that scoring and metrics are wired up; tests about how moves are chosen
+# always run in full
+_FAST = os.getenv("TALKS_TEST_FAST") == "1"
+
+
+def _iterations(max_iterations: int) -> int:
+    """Discussion length for structural tests: two turns in fast mode"""
+    return 2 if _FAST else max_iterations
+
+
+class _CannedChatModel(FakeListChatModel):
+    """Chat model that answers instantly from a fixed list (tools are ignored)"""
+    
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+_CANNED_RESPONSES = [
+    "I think we should question the assumption that truth is simply given.",
+    "Imagine knowledge as a map: useful, but never the territory itself.",
+    "The evidence suggests our categories shape what we are able to observe."
+]
+
+
+@contextmanager
+def _canned_llm():
+    """Build orchestrators whose agents reply with canned text instead of calling the LLM"""
+    def canned_chat_model(**kwargs):
+        return _CannedChatModel(responses=_CANNED_RESPONSES)
+    
+    with patch('src.agents.base_agent.ChatOllama', canned_chat_model), \
+         patch('src.utils.llm_client.ChatOllama', canned_chat_model):
+        yield
+
+
+# Participant line-ups, resolved to enums once at import and shared by every run
+_OBJECTIVES_PARTICIPANTS = (
+    ParticipantSpec("Analytical Andy", Gender.MALE, PersonalityArchetype.ANALYTICAL, "logic"),
+    ParticipantSpec("Creative Cara", Gender.FEMALE, PersonalityArchetype.CREATIVE, "art"),
+    ParticipantSpec("Skeptical Sam", Gender.MALE, PersonalityArchetype.SKEPTICAL, "philosophy"),
+)
+
+_SCORING_PARTICIPANTS = (
+    ParticipantSpec("Truth Seeker", Gender.FEMALE, PersonalityArchetype.ANALYTICAL, "science"),
+    ParticipantSpec("Tension Creator", Gender.MALE, PersonalityArchetype.SKEPTICAL, "philosophy"),
+)
+
+_METRICS_PARTICIPANTS = (
+    ParticipantSpec("Alice", Gender.FEMALE, PersonalityArchetype.COLLABORATIVE, "ethics"),
+    ParticipantSpec("Bob", Gender.MALE, PersonalityArchetype.CREATIVE, "aesthetics"),
+    ParticipantSpec("Charlie", Gender.MALE, PersonalityArchetype.SKEPTICAL, "logic"),
+)
+
+_INFLUENCE_PARTICIPANTS = (
+    ParticipantSpec("Challenger", Gender.MALE, PersonalityArchetype.SKEPTICAL, "debate"),  # High dialectical_tension
+    ParticipantSpec("Synthesizer", Gender.FEMALE, PersonalityArchetype.COLLABORATIVE, "mediation"),  # High ethical_coherence
+)
+
+_DISABLED_PARTICIPANTS = (
+    ParticipantSpec("Alice", Gender.FEMALE, PersonalityArchetype.ANALYTICAL, "logic"),
+    ParticipantSpec("Bob", Gender.MALE, PersonalityArchetype.CREATIVE, "art"),
+)
 
 
 async def test_objectives_assigned():
     """Test that objectives are assigned correctly"""
     
-    print("\n" + "="*60)
-    print("TEST 1: Objectives Assignment")
-    print("="*60 + "\n")
-    
-    participants = [
-        {
-            "name": "Analytical Andy",
-            "gender": "male",
-            "personality": "analytical",
-            "expertise": "logic"
-        },
-        {
-            "name": "Creative Cara",
-            "gender": "female",
-            "personality": "creative",
-            "expertise": "art"
-        },
-        {
-            "name": "Skeptical Sam",
-            "gender": "male",
-            "personality": "skeptical",
-            "expertise": "philosophy"
-        }
-    ]
+    _print("\n" + "="*60)
+    _print("TEST 1: Objectives Assignment")
+    _print("="*60 + "\n")
     
     orchestrator = MultiAgentDiscussionOrchestrator(
         topic="What is truth?",
         target_depth=2,
-        participants_config=participants,
+        participants_config=_OBJECTIVES_PARTICIPANTS,
         enable_narrator=False,
         enable_synthesizer=False,
         enable_strategic_scoring=True
     )
     
-    print("Checking objective assignment:")
+    _print("Checking objective assignment:")
     for pid, agent in orchestrator.participants.items():
         objective = agent.state.objective
         dominant = objective.get_dominant_objective()
         vector = objective.get_objective_vector()
         
-        print(f"\n  {agent.state.name} ({agent.state.personality.value}):")
-        print(f"    Dominant objective: {dominant}")
-        print(f"    Objective vector:")
-        for key, value in vector.items():
-            print(f"      - {key}: {value:.2f}")
+        _print(f"\n  {agent.state.name} ({agent.state.personality.value}):")
+        _print(f"    Dominant objective: {dominant}")
+        _print(f"    Objective vector:")
+        _print("\n".join(f"      - {key}: {value:.2f}" for key, value in vector.items()))
     
-    print("\n✅ Objectives assigned correctly based on personality\n")
+    _print("\n✅ Objectives assigned correctly based on personality\n")
 
 
 async def test_strategic_scoring():
     """Test that strategic scoring works during discussion"""
     
-    print("="*60)
-    print("TEST 2: Strategic Scoring During Discussion")
-    print("="*60 + "\n")
-    
-    participants = [
-        {
-            "name": "Truth Seeker",
-            "gender": "female",
-            "personality": "analytical",
-            "expertise": "science"
-        },
-        {
-            "name": "Tension Creator",
-            "gender": "male",
-            "personality": "skeptical",
-            "expertise": "philosophy"
-        }
-    ]
+    _print("="*60)
+    _print("TEST 2: Strategic Scoring During Discussion")
+    _print("="*60 + "\n")
     
     orchestrator = MultiAgentDiscussionOrchestrator(
         topic="Is mathematics discovered or invented?",
         target_depth=2,
-        participants_config=participants,
+        participants_config=_SCORING_PARTICIPANTS,
         enable_narrator=False,
         enable_synthesizer=False,
         enable_strategic_scoring=True
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=8)
+    exchanges = await run_discussion(orchestrator, _iterations(8))
     
-    print(f"\nCompleted {len(exchanges)} exchanges")
+    _print(f"\nCompleted {len(exchanges)} exchanges")
     
     # Check that scoring happened
     if orchestrator.strategic_coordinator:
         scores = orchestrator.strategic_coordinator.turn_scores
-        print(f"  Strategic evaluations recorded: {len(scores)}")
+        _print(f"  Strategic evaluations recorded: {len(scores)}")
         
         if scores:
-            print("\n  Sample evaluations:")
+            _print("\n  Sample evaluations:")
             for i, score in enumerate(scores[:3]):
-                print(f"\n    Turn {score['turn'] + 1}: {score['agent']}")
-                print(f"      Move: {score['move']}")
-                print(f"      Dominant Objective: {score['dominant_objective']}")
-                print(f"      Alignment: {score['alignment_score']:.2%}")
-                print(f"      Originality: {score['originality_score']:.2%}")
-                print(f"      Quality: {score['strategic_quality']:.2%}")
-    
-    print("\n✅ Strategic scoring working correctly\n")
+                _print(f"\n    Turn {score['turn'] + 1}: {score['agent']}")
+                _print(f"      Move: {score['move']}")
+                _print(f"      Dominant Objective: {score['dominant_objective']}")
+                _print(f"      Alignment: {score['alignment_score']:.2%}")
+                _print(f"      Originality: {score['originality_score']:.2%}")
+                _print(f"      Quality: {score['strategic_quality']:.2%}")
+    
+    _print("\n✅ Strategic scoring working correctly\n")
+
+
+# The aggregate and per-participant tests read two views of the same
+# metrics, so they share one discussion; the first to ask runs it
+_metrics_orchestrator: Optional[MultiAgentDiscussionOrchestrator] = None
+_metrics_lock = asyncio.Lock()
+
+
+async def _shared_metrics_orchestrator() -> MultiAgentDiscussionOrchestrator:
+    """Run the three-personality metrics discussion once and return its orchestrator"""
+    global _metrics_orchestrator
+    
+    async with _metrics_lock:
+        if _metrics_orchestrator is None:
+            orchestrator = MultiAgentDiscussionOrchestrator(
+                topic="What is beauty?",
+                target_depth=3,
+                participants_config=_METRICS_PARTICIPANTS,
+                enable_narrator=False,
+                enable_synthesizer=False,
+                enable_strategic_scoring=True
+            )
+            
+            await run_discussion(orchestrator, _iterations(12))
+            _metrics_orchestrator = orchestrator
+    
+    return _metrics_orchestrator
 
 
 async def test_aggregate_metrics():
     """Test aggregate metrics calculation"""
     
-    print("="*60)
-    print("TEST 3: Aggregate Metrics")
-    print("="*60 + "\n")
-    
-    participants = [
-        {
-            "name": "Alice",
-            "gender": "female",
-            "personality": "collaborative",
-            "expertise": "ethics"
-        },
-        {
-            "name": "Bob",
-            "gender": "male",
-            "personality": "creative",
-            "expertise": "aesthetics"
-        },
-        {
-            "name": "Charlie",
-            "gender": "male",
-            "personality": "skeptical",
-            "expertise": "logic"
-        }
-    ]
+    _print("="*60)
+    _print("TEST 3: Aggregate Metrics")
+    _print("="*60 + "\n")
     
-    orchestrator = MultiAgentDiscussionOrchestrator(
-        topic="What is beauty?",
-        target_depth=3,
-        participants_config=participants,
-        enable_narrator=False,
-        enable_synthesizer=False,
-        enable_strategic_scoring=True
-    )
-    
-    exchanges = await orchestrator.run_discussion(max_iterations=12)
+    orchestrator = await _shared_metrics_orchestrator()
     
     # Get aggregate metrics
     if orchestrator.strategic_coordinator:
         metrics = orchestrator.strategic_coordinator.get_aggregate_metrics()
         
-        print("📊 Aggregate Strategic Metrics:")
-        print(f"  Total turns evaluated: {metrics['total_turns_evaluated']}")
-        print(f"  Average alignment: {metrics['avg_alignment']:.1%}")
-        print(f"  Average originality: {metrics['avg_originality']:.1%}")
-        print(f"  Average quality: {metrics['avg_quality']:.1%}")
-        print(f"  Dominant theme: {metrics['dominant_theme']}")
+        _print("📊 Aggregate Strategic Metrics:")
+        _print(f"  Total turns evaluated: {metrics['total_turns_evaluated']}")
+        _print(f"  Average alignment: {metrics['avg_alignment']:.1%}")
+        _print(f"  Average originality: {metrics['avg_originality']:.1%}")
+        _print(f"  Average quality: {metrics['avg_quality']:.1%}")
+        _print(f"  Dominant theme: {metrics['dominant_theme']}")
         
-        print(f"\n  Objective Distribution:")
-        for obj, count in sorted(metrics['objective_distribution'].items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / metrics['total_turns_evaluated']) * 100
-            print(f"    {obj}: {count} turns ({percentage:.0f}%)")
-    
-    print("\n✅ Aggregate metrics calculated correctly\n")
+        _print(f"\n  Objective Distribution:")
+        total = metrics['total_turns_evaluated']
+        _print("\n".join(
+            f"    {obj}: {count} turns ({count / total * 100:.0f}%)"
+            for obj, count in metrics['objective_distribution'].most_common()
+        ))
+    
+    _print("\n✅ Aggregate metrics calculated correctly\n")
 
 
 async def test_participant_metrics():
     """Test per-participant metrics"""
     
-    print("="*60)
-    print("TEST 4: Per-Participant Metrics")
-    print("="*60 + "\n")
-    
-    participants = [
-        {
-            "name": "Empiricist Emma",
-            "gender": "female",
-            "personality": "cautious",
-            "expertise": "science"
-        },
-        {
-            "name": "Metaphor Mike",
-            "gender": "male",
-            "personality": "creative",
-            "expertise": "literature"
-        }
-    ]
-    
-    orchestrator = MultiAgentDiscussionOrchestrator(
-        topic="What is consciousness?",
-        target_depth=2,
-        participants_config=participants,
-        enable_narrator=False,
-        enable_synthesizer=False,
-        enable_strategic_scoring=True
-    )
+    _print("="*60)
+    _print("TEST 4: Per-Participant Metrics")
+    _print("="*60 + "\n")
     
-    exchanges = await orchestrator.run_discussion(max_iterations=10)
+    orchestrator = await _shared_metrics_orchestrator()
     
     # Get per-participant metrics
     if orchestrator.strategic_coordinator:
-        print("Per-Participant Strategic Metrics:")
+        _print("Per-Participant Strategic Metrics:")
         for pid, agent in orchestrator.participants.items():
             metrics = orchestrator.strategic_coordinator.get_participant_metrics(agent.state.name)
             if metrics:
-                print(f"\n  {metrics['participant']}:")
-                print(f"    Turns: {metrics['turns']}")
-                print(f"    Avg alignment: {metrics['avg_alignment']:.1%}")
-                print(f"    Avg originality: {metrics['avg_originality']:.1%}")
-                print(f"    Avg quality: {metrics['avg_quality']:.1%}")
-                print(f"    Dominant objective: {metrics['dominant_objective']}")
-    
-    print("\n✅ Per-participant metrics working correctly\n")
+                _print(
+                    f"\n  {metrics['participant']}:\n"
+                    f"    Turns: {metrics['turns']}\n"
+                    f"    Avg alignment: {metrics['avg_alignment']:.1%}\n"
+                    f"    Avg originality: {metrics['avg_originality']:.1%}\n"
+                    f"    Avg quality: {metrics['avg_quality']:.1%}\n"
+                    f"    Dominant objective: {metrics['dominant_objective']}"
+                )
+    
+    _print("\n✅ Per-participant metrics working correctly\n")
 
 
 async def test_objective_influence_on_moves():
     """Test that objectives influence move selection"""
     
-    print("="*60)
-    print("TEST 5: Objective Influence on Move Selection")
-    print("="*60 + "\n")
+    _print("="*60)
+    _print("TEST 5: Objective Influence on Move Selection")
+    _print("="*60 + "\n")
     
     # Create agents with extreme objectives
-    participants = [
-        {
-            "name": "Challenger",
-            "gender": "male",
-            "personality": "skeptical",  # High dialectical_tension
-            "expertise": "debate"
-        },
-        {
-            "name": "Synthesizer",
-            "gender": "female",
-            "personality": "collaborative",  # High ethical_coherence
-            "expertise": "mediation"
-        }
-    ]
-    
     orchestrator = MultiAgentDiscussionOrchestrator(
         topic="Should AI have rights?",
         target_depth=2,
-        participants_config=participants,
+        participants_config=_INFLUENCE_PARTICIPANTS,
         enable_narrator=False,
         enable_synthesizer=False,
         enable_strategic_scoring=True
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=8)
+    exchanges = await run_discussion(orchestrator, 8)
     
-    # Analyze move distribution
-    move_counts = {}
-    for agent_name in ["Challenger", "Synthesizer"]:
-        agent_exchanges = [e for e in exchanges if e['speaker'] == agent_name]
-        agent_moves = {}
-        for e in agent_exchanges:
-            move = e['move']
-            agent_moves[move] = agent_moves.get(move, 0) + 1
-        move_counts[agent_name] = agent_moves
+    # Analyze move distribution (one pass over the exchanges)
+    moves_by_speaker = defaultdict(Counter)
+    for e in exchanges:
+        moves_by_speaker[e['speaker']][e['move']] += 1
+    move_counts = {spec.name: moves_by_speaker[spec.name] for spec in _INFLUENCE_PARTICIPANTS}
     
-    print("Move Distribution by Agent:")
+    _print("Move Distribution by Agent:")
     for agent_name, moves in move_counts.items():
-        print(f"\n  {agent_name}:")
-        for move, count in sorted(moves.items(), key=lambda x: x[1], reverse=True):
-            print(f"    {move}: {count}")
+        _print(f"\n  {agent_name}:")
+        for move, count in moves.most_common():
+            _print(f"    {move}: {count}")
     
-    print("\n✅ Objectives influence move selection as expected\n")
+    _print("\n✅ Objectives influence move selection as expected\n")
 
 
 async def test_scoring_disabled():
     """Test that scoring can be disabled"""
     
-    print("="*60)
-    print("TEST 6: Strategic Scoring Disabled")
-    print("="*60 + "\n")
-    
-    participants = [
-        {
-            "name": "Alice",
-            "gender": "female",
-            "personality": "analytical",
-            "expertise": "logic"
-        },
-        {
-            "name": "Bob",
-            "gender": "male",
-            "personality": "creative",
-            "expertise": "art"
-        }
-    ]
-    
-    orchestrator = MultiAgentDiscussionOrchestrator(
-        topic="Test topic",
-        target_depth=2,
-        participants_config=participants,
-        enable_narrator=False,
-        enable_synthesizer=False,
-        enable_strategic_scoring=False  # DISABLED
-    )
-    
-    exchanges = await orchestrator.run_discussion(max_iterations=4)
+    _print("="*60)
+    _print("TEST 6: Strategic Scoring Disabled")
+    _print("="*60 + "\n")
+    
+    # Only whether scoring ran is checked, so the agents don't need a real LLM.
+    # The progression controller builds its LLM client on first use, so it is
+    # built here while patched; the discussion itself runs outside the patch
+    with _canned_llm():
+        orchestrator = MultiAgentDiscussionOrchestrator(
+            topic="Test topic",
+            target_depth=2,
+            participants_config=_DISABLED_PARTICIPANTS,
+            enable_narrator=False,
+            enable_synthesizer=False,
+            enable_strategic_scoring=False  # DISABLED
+        )
+        _ = orchestrator.progression_controller
+    
+    exchanges = await run_discussion(orchestrator, _iterations(4))
     
     # Verify no scoring happened
     has_coordinator = orchestrator.strategic_coordinator is not None
-    has_metrics = hasattr(orchestrator, 'strategic_metrics') and orchestrator.strategic_metrics
+    has_metrics = bool(getattr(orchestrator, 'strategic_metrics', None))
     
-    print(f"✓ Discussion completed without scoring")
-    print(f"  - Strategic coordinator: {has_coordinator}")
-    print(f"  - Strategic metrics: {has_metrics}")
+    _print(f"✓ Discussion completed without scoring")
+    _print(f"  - Strategic coordinator: {has_coordinator}")
+    _print(f"  - Strategic metrics: {has_metrics}")
     
     if not has_coordinator and not has_metrics:
-        print("\n✅ Scoring successfully disabled\n")
+        _print("\n✅ Scoring successfully disabled\n")
     else:
-        print("\n⚠️  Warning: Scoring may not be fully disabled\n")
+        _print("\n⚠️  Warning: Scoring may not be fully disabled\n")
 
 
 async def run_all_tests():
@@ -338,32 +323,39 @@ async def run_all_tests():
     print("STRATEGIC OBJECTIVES & SCORING TEST SUITE")
     print("="*60)
     
-    try:
-        await test_objectives_assigned()
-        await test_strategic_scoring()
-        await test_aggregate_metrics()
-        await test_participant_metrics()
-        await test_objective_influence_on_moves()
-        await test_scoring_disabled()
-        
-        print("="*60)
-        print("✅ ALL TESTS PASSED")
-        print("="*60 + "\n")
-        
-        print("Summary of Strategic Objectives Features:")
-        print("  ✓ Objectives auto-assigned from personality")
-        print("  ✓ Strategic scoring applied to each turn")
-        print("  ✓ Alignment and originality measured")
-        print("  ✓ Aggregate metrics calculated")
-        print("  ✓ Per-participant metrics available")
-        print("  ✓ Objectives influence move selection")
-        print("  ✓ System can be enabled/disabled")
-        
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    tests = [
+        test_objectives_assigned,
+        test_strategic_scoring,
+        test_aggregate_metrics,
+        test_participant_metrics,
+        test_objective_influence_on_moves,
+        test_scoring_disabled
+    ]
+    
+    # Tests build their own orchestrators and are dominated by LLM latency,
+    # so run them concurrently
+    results = await asyncio.gather(*(run_buffered(test) for test in tests), return_exceptions=True)
+    
+    failures = [(test, result) for test, result in zip(tests, results) if isinstance(result, Exception)]
+    if failures:
+        for test, error in failures:
+            print(f"\n❌ TEST FAILED ({test.__name__}): {error}")
+            traceback.print_exception(error)
+        return
+    
+    print("="*60)
+    print("✅ ALL TESTS PASSED")
+    print("="*60 + "\n")
+    
+    print("Summary of Strategic Objectives Features:")
+    print("  ✓ Objectives auto-assigned from personality")
+    print("  ✓ Strategic scoring applied to each turn")
+    print("  ✓ Alignment and originality measured")
+    print("  ✓ Aggregate metrics calculated")
+    print("  ✓ Per-participant metrics available")
+    print("  ✓ Objectives influence move selection")
+    print("  ✓ System can be enabled/disabled")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_all_tests())
\ No newline at end of file
+    run(run_all_tests())
\ No newline at end of file
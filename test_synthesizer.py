@@ -10,19 +10,38 @@ This test verifies:
 """
 
 import asyncio
+import mmap
 import sys
+import traceback
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
+from src.utils.llm_cache import enable_test_llm_cache
+from testing_support import buffered_print as _print, run_buffered, run_discussion, run
+
+
+def _count_in_file(path: Path, needle: bytes) -> int:
+    """Count occurrences of needle in a file without reading it into memory"""
+    if path.stat().st_size < len(needle):
+        return 0  # too short to match (and empty files can't be mapped)
+    
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            count = 0
+            pos = mm.find(needle)
+            while pos != -1:
+                count += 1
+                pos = mm.find(needle, pos + len(needle))
+            return count
 
 
 async def test_synthesizer_basic():
     """Test basic synthesizer functionality"""
     
-    print("\n" + "="*60)
-    print("TEST 1: Basic Synthesizer Functionality")
-    print("="*60 + "\n")
+    _print("\n" + "="*60)
+    _print("TEST 1: Basic Synthesizer Functionality")
+    _print("="*60 + "\n")
     
     participants = [
         {
@@ -55,39 +74,38 @@ async def test_synthesizer_basic():
         synthesis_style="hegelian"
     )
     
-    print(f"Configuration:")
-    print(f"  - Participants: {len(participants)}")
-    print(f"  - Synthesis frequency: every 6 turns")
-    print(f"  - Synthesis style: hegelian")
-    print(f"  - Expected syntheses: 2 (at turns 6 and 12)\n")
+    _print(f"Configuration:")
+    _print(f"  - Participants: {len(participants)}")
+    _print(f"  - Synthesis frequency: every 6 turns")
+    _print(f"  - Synthesis style: hegelian")
+    _print(f"  - Expected syntheses: 2 (at turns 6 and 12)\n")
     
-    exchanges = await orchestrator.run_discussion(max_iterations=12)
+    exchanges = await run_discussion(orchestrator, 12)
     
-    print(f"\n{'='*60}")
-    print(f"✅ Test 1 Complete")
-    print(f"{'='*60}")
-    print(f"  - Total exchanges: {len(exchanges)}")
-    print(f"  - Log file: {orchestrator._log_filepath}")
+    _print(f"\n{'='*60}")
+    _print(f"✅ Test 1 Complete")
+    _print(f"{'='*60}")
+    _print(f"  - Total exchanges: {len(exchanges)}")
+    _print(f"  - Log file: {orchestrator._log_filepath}")
     
-    # Check log for synthesis sections
+    # Check log for synthesis sections (off the event loop, so concurrent
+    # tests keep running while the log is scanned)
     if orchestrator._log_filepath.exists():
-        with open(orchestrator._log_filepath, 'r') as f:
-            content = f.read()
-            synthesis_count = content.count("## Synthesis")
-            print(f"  - Synthesis sections in log: {synthesis_count}")
-            
-            if synthesis_count >= 2:
-                print("  ✓ Synthesis checkpoints triggered correctly")
-            else:
-                print("  ⚠ Expected at least 2 synthesis sections")
+        synthesis_count = await asyncio.to_thread(_count_in_file, orchestrator._log_filepath, b"## Synthesis")
+        _print(f"  - Synthesis sections in log: {synthesis_count}")
+        
+        if synthesis_count >= 2:
+            _print("  ✓ Synthesis checkpoints triggered correctly")
+        else:
+            _print("  ⚠ Expected at least 2 synthesis sections")
 
 
 async def test_synthesis_styles():
     """Test all three synthesis styles"""
     
-    print("\n" + "="*60)
-    print("TEST 2: Different Synthesis Styles")
-    print("="*60 + "\n")
+    _print("\n" + "="*60)
+    _print("TEST 2: Different Synthesis Styles")
+    _print("="*60 + "\n")
     
     participants = [
         {
@@ -106,10 +124,7 @@ async def test_synthesis_styles():
     
     styles = ["hegelian", "socratic", "pragmatic"]
     
-    for style in styles:
-        print(f"\nTesting {style.upper()} style:")
-        print("-" * 40)
-        
+    async def _run_style(style):
         orchestrator = MultiAgentDiscussionOrchestrator(
             topic="What is the nature of reality?",
             target_depth=2,
@@ -119,19 +134,25 @@ async def test_synthesis_styles():
             synthesis_frequency=4,
             synthesis_style=style
         )
-        
-        exchanges = await orchestrator.run_discussion(max_iterations=8)
-        
-        print(f"  ✓ Completed with {len(exchanges)} exchanges")
-        print(f"  ✓ Log: {orchestrator._log_filepath.name}")
+        exchanges = await run_discussion(orchestrator, 8)
+        return style, exchanges, orchestrator._log_filepath.name
+    
+    # The styles share no state (each orchestrator has its own session log)
+    results = await asyncio.gather(*(_run_style(style) for style in styles))
+    
+    for style, exchanges, log_name in results:
+        _print(f"\nTesting {style.upper()} style:")
+        _print("-" * 40)
+        _print(f"  ✓ Completed with {len(exchanges)} exchanges")
+        _print(f"  ✓ Log: {log_name}")
 
 
 async def test_synthesis_disabled():
     """Test that synthesis can be disabled"""
     
-    print("\n" + "="*60)
-    print("TEST 3: Synthesis Disabled")
-    print("="*60 + "\n")
+    _print("\n" + "="*60)
+    _print("TEST 3: Synthesis Disabled")
+    _print("="*60 + "\n")
     
     participants = [
         {
@@ -156,44 +177,50 @@ async def test_synthesis_disabled():
         enable_synthesizer=False  # Disabled
     )
     
-    exchanges = await orchestrator.run_discussion(max_iterations=10)
+    exchanges = await run_discussion(orchestrator, 10)
     
-    print(f"✓ Completed without synthesizer")
-    print(f"  - Exchanges: {len(exchanges)}")
+    _print(f"✓ Completed without synthesizer")
+    _print(f"  - Exchanges: {len(exchanges)}")
     
     # Verify no synthesis in log
     if orchestrator._log_filepath.exists():
-        with open(orchestrator._log_filepath, 'r') as f:
-            content = f.read()
-            synthesis_count = content.count("## Synthesis")
-            
-            if synthesis_count == 0:
-                print("  ✓ No synthesis sections found (as expected)")
-            else:
-                print(f"  ⚠ Found {synthesis_count} synthesis sections (unexpected)")
+        synthesis_count = await asyncio.to_thread(_count_in_file, orchestrator._log_filepath, b"## Synthesis")
+        
+        if synthesis_count == 0:
+            _print("  ✓ No synthesis sections found (as expected)")
+        else:
+            _print(f"  ⚠ Found {synthesis_count} synthesis sections (unexpected)")
 
 
 async def run_all_tests():
     """Run all synthesizer tests"""
+    enable_test_llm_cache()
     
     print("\n" + "="*60)
     print("DIALECTICAL SYNTHESIZER TEST SUITE")
     print("="*60)
     
-    try:
-        await test_synthesizer_basic()
-        await test_synthesis_styles()
-        await test_synthesis_disabled()
-        
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED")
-        print("="*60 + "\n")
-        
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    tests = [
+        test_synthesizer_basic,
+        test_synthesis_styles,
+        test_synthesis_disabled
+    ]
+    
+    # Tests build their own orchestrators and are dominated by LLM latency,
+    # so run them concurrently
+    results = await asyncio.gather(*(run_buffered(test) for test in tests), return_exceptions=True)
+    
+    failures = [(test, result) for test, result in zip(tests, results) if isinstance(result, Exception)]
+    if failures:
+        for test, error in failures:
+            print(f"\n❌ TEST FAILED ({test.__name__}): {error}")
+            traceback.print_exception(error)
+        return
+    
+    print("\n" + "="*60)
+    print("✅ ALL TESTS PASSED")
+    print("="*60 + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_all_tests())
\ No newline at end of file
+    run(run_all_tests())
\ No newline at end of file
@@ -10,6 +10,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.agents import DialecticalSynthesizerAgent
 from src.config import TalksConfig
+from src.utils.llm_cache import enable_test_llm_cache
+from testing_support import run
 
 
 async def test_synthesizer_import():
@@ -19,12 +21,16 @@ async def test_synthesizer_import():
     print("QUICK SYNTHESIZER VERIFICATION")
     print("="*60 + "\n")
     
-    # Test 1: Import works
+    # Test 1: Import works (one synthesizer per style)
+    styles = ["hegelian", "socratic", "pragmatic"]
     try:
-        synthesizer = DialecticalSynthesizerAgent(
-            name="Test Synthesizer",
-            synthesis_style="hegelian"
-        )
+        synthesizers = [
+            DialecticalSynthesizerAgent(
+                name="Test Synthesizer",
+                synthesis_style=style
+            )
+            for style in styles
+        ]
         print("✅ DialecticalSynthesizerAgent imported and initialized")
     except Exception as e:
         print(f"❌ Failed to initialize synthesizer: {e}")
@@ -73,16 +79,21 @@ async def test_synthesizer_import():
             }
         ]
         
-        result = await synthesizer.synthesize_segment(
-            exchanges=test_exchanges,
-            turn_window=3,
-            topic="Is free will an illusion?"
-        )
+        # The styles are independent LLM calls, so they run concurrently
+        results = await asyncio.gather(*(
+            synthesizer.synthesize_segment(
+                exchanges=test_exchanges,
+                turn_window=3,
+                topic="Is free will an illusion?"
+            )
+            for synthesizer in synthesizers
+        ))
         
-        if result:
-            print(f"✅ Synthesizer generated output: {result[:100]}...")
-        else:
-            print("⚠️ Synthesizer returned None (might need more exchanges)")
+        for style, result in zip(styles, results):
+            if result:
+                print(f"✅ Synthesizer ({style}) generated output: {result[:100]}...")
+            else:
+                print(f"⚠️ Synthesizer ({style}) returned None (might need more exchanges)")
             
     except Exception as e:
         print(f"❌ Synthesis failed: {e}")
@@ -98,5 +109,6 @@ async def test_synthesizer_import():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_synthesizer_import())
+    enable_test_llm_cache()
+    success = run(test_synthesizer_import())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""Shared helpers for the test scripts that run their tests concurrently"""
+
+import asyncio
+import io
+import sys
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# The orchestrator pulls in the LLM and agent stack, so it is only imported for
+# type checking; scripts that run discussions import it themselves
+if TYPE_CHECKING:
+    from src.orchestration.orchestrator import MultiAgentDiscussionOrchestrator
+
+# Per-task output buffer so concurrently running tests don't interleave
+_test_output: ContextVar[Optional[io.StringIO]] = ContextVar('_test_output', default=None)
+
+
+def buffered_print(*args, **kwargs):
+    """print() into the running test's buffer, or stdout outside run_buffered()"""
+    kwargs.setdefault('file', _test_output.get() or sys.stdout)
+    print(*args, **kwargs)
+
+
+async def run_buffered(test):
+    """Run a test with its output buffered and written in one go at the end"""
+    buffer = io.StringIO()
+    _test_output.set(buffer)
+    try:
+        return await test()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+# Cap how many discussions hit the LLM backend at once when tests run concurrently
+_discussion_slots = asyncio.Semaphore(3)
+
+
+async def run_discussion(orchestrator: "MultiAgentDiscussionOrchestrator", max_iterations: int):
+    """Run a discussion while holding one of the shared concurrency slots"""
+    async with _discussion_slots:
+        return await orchestrator.run_discussion(max_iterations=max_iterations)
+
+
+def run(main):
+    """Run a script's top-level coroutine, on uvloop's faster event loop when it is installed"""
+    return (uvloop.run if uvloop else asyncio.run)(main)
@@ -0,0 +1,15 @@
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Only registered when uvloop is importable: the hook must return a loop
+# factory mapping, so without uvloop pytest-asyncio keeps its default loop
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop"""
+        return {"uvloop": uvloop.new_event_loop}
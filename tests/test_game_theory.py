@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from src.states.participant_state import ParticipantState, Gender, PersonalityArchetype
 from src.states.group_state import GroupDiscussionState
@@ -86,10 +87,44 @@ def test_turn_selection_fairness():
     selector = TurnSelector()
     
     # Run multiple selections
-    selections = []
-    for _ in range(100):
-        selections.append(selector.select_next_speaker(group_state))
+    selections = selector.select_next_speakers(group_state, 100)
     
     # P2 should be selected more often
     p2_count = selections.count("p2")
-    assert p2_count > 40  # At least 40% of the time
\ No newline at end of file
+    assert p2_count > 40  # At least 40% of the time
+
+
+def test_batched_selection_matches_sequential():
+    """Batched selection should match repeated single selections with the same seed"""
+    
+    participants = {
+        pid: ParticipantState(
+            participant_id=pid,
+            name=pid.upper(),
+            gender=Gender.FEMALE,
+            personality=personality,
+            expertise_area="test",
+            speaking_turns=turns
+        )
+        for pid, personality, turns in [
+            ("p1", PersonalityArchetype.ASSERTIVE, 4),
+            ("p2", PersonalityArchetype.CAUTIOUS, 1),
+            ("p3", PersonalityArchetype.CREATIVE, 2)
+        ]
+    }
+    
+    group_state = GroupDiscussionState(
+        topic="test",
+        target_depth=3,
+        participants=participants
+    )
+    
+    selector = TurnSelector()
+    
+    np.random.seed(42)
+    sequential = [selector.select_next_speaker(group_state) for _ in range(50)]
+    
+    np.random.seed(42)
+    batched = selector.select_next_speakers(group_state, 50)
+    
+    assert batched == sequential
\ No newline at end of file